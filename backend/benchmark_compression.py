@@ -0,0 +1,48 @@
+"""
+Measure CPU cost versus bytes saved when compressing representative API responses
+Run with: python benchmark_compression.py [--documents 100] [--repeat 20]
+"""
+
+import argparse
+import gzip
+import statistics
+import time
+
+from benchmark_serialization import order_documents, product_documents
+from server import ORDER_DEFAULTS, PRODUCT_DEFAULTS, FastJSONResponse, brotli, trusted_documents
+
+def codecs():
+    for level in (1, 6, 9):
+        yield f"gzip-{level}", lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0)
+    if brotli:
+        for quality in (1, 4, 6, 11):
+            yield f"br-{quality}", lambda body, quality=quality: brotli.compress(body, quality=quality)
+
+def measure(name: str, body: bytes, repeat: int):
+    print(f"📦 {name}: {len(body)} bytes uncompressed")
+    for codec, compress in codecs():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            compressed = compress(body)
+            timings.append(time.perf_counter() - started)
+        ms = statistics.median(timings) * 1000
+        saved = len(body) - len(compressed)
+        print(
+            f"   {codec:8} {len(compressed):9} bytes  {len(compressed) / len(body):6.1%}  "
+            f"{ms:8.2f} ms  {saved / 1024 / ms if ms else 0:8.1f} KiB saved per ms"
+        )
+
+def main(documents: int, repeat: int):
+    # GET /api/products (default page size 100) and GET /api/orders/my
+    products = FastJSONResponse(trusted_documents(product_documents(documents), PRODUCT_DEFAULTS)).body
+    orders = FastJSONResponse(trusted_documents(order_documents(documents), ORDER_DEFAULTS)).body
+    measure(f"/api/products ({documents} documents)", products, repeat)
+    measure(f"/api/orders/my ({documents} documents)", orders, repeat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark response compression")
+    parser.add_argument("--documents", type=int, default=100, help="documents per response")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per codec")
+    args = parser.parse_args()
+    main(args.documents, args.repeat)
@@ -0,0 +1,115 @@
+"""
+Compare response serialization cost of the response_model path with FastJSONResponse
+Run with: python benchmark_serialization.py [--documents 1000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from server import (
+    ORDER_DEFAULTS,
+    PRODUCT_DEFAULTS,
+    FastJSONResponse,
+    Order,
+    Product,
+    trusted_documents,
+)
+
+def product_documents(count: int) -> List[dict]:
+    """Shaped like products as Motor returns them: naive UTC datetimes, no _id"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "seller_id": str(uuid.uuid4()),
+            "name": f"Cotton Crew Neck T-Shirt {i}",
+            "description": "Soft breathable cotton tee with a relaxed fit, ribbed neckline and double-stitched hems. " * 3,
+            "category": ["Men", "Women", "Kids", "Footwear"][i % 4],
+            "price": 499.0 + i % 500,
+            "mrp": 999.0,
+            "sku": f"SKU-{i:06d}",
+            "images": [f"https://images.example.com/products/{i}/{n}.jpg" for n in range(4)],
+            "videos": [],
+            "specifications": {"Material": "Cotton", "Fit": "Regular", "Sleeve": "Half"},
+            "filters": {"brand": "Acme", "size": ["S", "M", "L"], "color": "Black"},
+            "colors": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}],
+            "sizes": ["S", "M", "L", "XL"],
+            "color_images": {"Black": ["https://images.example.com/black.jpg"]},
+            "is_active": True,
+            "view_count": i * 7,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i)
+        }
+        for i in range(count)
+    ]
+
+def order_documents(count: int) -> List[dict]:
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "customer_id": str(uuid.uuid4()),
+            "items": [
+                {"product_id": str(uuid.uuid4()), "seller_id": str(uuid.uuid4()), "name": f"Item {n}", "price": 499.0, "quantity": 1}
+                for n in range(3)
+            ],
+            "total_amount": 1497.0,
+            "status": "delivered",
+            "payment_status": "paid",
+            "shipping_address": {"name": "Asha", "line1": "12 MG Road", "city": "Pune", "pincode": "411001"},
+            "tracking_id": f"FMP{i:012d}",
+            "platform_fee_amount": 29.94,
+            "seller_payout": 1467.06,
+            "created_at": now - timedelta(hours=i),
+            "updated_at": now - timedelta(hours=i)
+        }
+        for i in range(count)
+    ]
+
+async def response_model_body(field, documents: List[dict]) -> bytes:
+    """What FastAPI does for a handler returning documents with response_model=List[Model]"""
+    content = await serialize_response(field=field, response_content=documents)
+    return JSONResponse(content).body
+
+def fast_body(documents: List[dict], defaults: dict) -> bytes:
+    return FastJSONResponse(trusted_documents(documents, defaults)).body
+
+async def measure(name: str, model: type, documents: List[dict], defaults: dict, repeat: int):
+    field = create_response_field(name=f"Response_{name}", type_=List[model])
+    before, after = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        slow = await response_model_body(field, documents)
+        before.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        fast = fast_body(documents, defaults)
+        after.append(time.perf_counter() - started)
+
+    per_1000 = 1000 / len(documents) * 1000
+    slow_ms = statistics.median(before) * per_1000
+    fast_ms = statistics.median(after) * per_1000
+    print(f"📦 {name}: {len(documents)} documents, median of {repeat} runs")
+    print(f"   response_model + json: {slow_ms:8.2f} ms per 1000 ({len(slow)} bytes)")
+    print(f"   FastJSONResponse:      {fast_ms:8.2f} ms per 1000 ({len(fast)} bytes)")
+    print(f"   speedup:               {slow_ms / fast_ms:8.1f}x")
+
+async def main(documents: int, repeat: int):
+    await measure("products", Product, product_documents(documents), PRODUCT_DEFAULTS, repeat)
+    await measure("orders", Order, order_documents(documents), ORDER_DEFAULTS, repeat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON response serialization")
+    parser.add_argument("--documents", type=int, default=1000, help="documents per response")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per path")
+    args = parser.parse_args()
+    asyncio.run(main(args.documents, args.repeat))
@@ -0,0 +1,37 @@
+"""
+Reconcile MongoDB indexes with the registry declared in server.py
+Run with: python reconcile_indexes.py [--check] [--drop-extra]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from server import client, reconcile_indexes
+
+async def main(check: bool, drop_extra: bool) -> int:
+    report = await reconcile_indexes(apply=not check, drop_extra=drop_extra)
+    client.close()
+    
+    if not report:
+        print("✅ All registered indexes are present")
+        return 0
+    
+    for collection_name, drift in report.items():
+        print(f"📂 {collection_name}")
+        for key in ("missing", "created", "failed", "extra", "dropped", "changed"):
+            if drift[key]:
+                print(f"   {key}: {', '.join(drift[key])}")
+    
+    unresolved = any(
+        drift["failed"] or drift["changed"] or (check and drift["missing"])
+        for drift in report.values()
+    )
+    return 1 if unresolved else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile MongoDB indexes with the server registry")
+    parser.add_argument("--check", action="store_true", help="report drift without creating indexes")
+    parser.add_argument("--drop-extra", action="store_true", help="drop indexes that are not in the registry")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.check, args.drop_extra)))
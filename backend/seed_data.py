@@ -43,7 +43,7 @@ async def seed_database():
         "role": "admin",
         "name": "Admin User",
         "phone": "1234567890",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.now(timezone.utc),
         "is_active": True
     }
     await db.users.insert_one(admin)
@@ -58,7 +58,7 @@ async def seed_database():
         "role": "seller",
         "name": "Fashion Store Owner",
         "phone": "9876543210",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.now(timezone.utc),
         "is_active": True
     }
     await db.users.insert_one(seller1_user)
@@ -76,8 +76,8 @@ async def seed_database():
         "state": "Maharashtra",
         "pincode": "400001",
         "status": "approved",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "approved_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.now(timezone.utc),
+        "approved_at": datetime.now(timezone.utc),
         "approved_by": admin_id
     }
     await db.sellers.insert_one(seller1)
@@ -92,7 +92,7 @@ async def seed_database():
         "role": "seller",
         "name": "Electronics Store Owner",
         "phone": "9876543211",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.now(timezone.utc),
         "is_active": True
     }
     await db.users.insert_one(seller2_user)
@@ -110,8 +110,8 @@ async def seed_database():
         "state": "Karnataka",
         "pincode": "560001",
         "status": "approved",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "approved_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.now(timezone.utc),
+        "approved_at": datetime.now(timezone.utc),
         "approved_by": admin_id
     }
     await db.sellers.insert_one(seller2)
@@ -126,7 +126,7 @@ async def seed_database():
         "role": "customer",
         "name": "John Doe",
         "phone": "9876543212",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": datetime.now(timezone.utc),
         "is_active": True
     }
     await db.users.insert_one(customer)
@@ -148,8 +148,8 @@ async def seed_database():
             "sizes": ["S", "M", "L", "XL", "XXL"],
             "colors": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}, {"name": "Navy", "hex": "#000080"}],
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -165,8 +165,8 @@ async def seed_database():
             "sizes": ["28", "30", "32", "34", "36"],
             "colors": [{"name": "Blue", "hex": "#0000FF"}, {"name": "Black", "hex": "#000000"}],
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -182,8 +182,8 @@ async def seed_database():
             "sizes": ["UK 6", "UK 7", "UK 8", "UK 9", "UK 10"],
             "colors": [{"name": "White", "hex": "#FFFFFF"}, {"name": "Black", "hex": "#000000"}, {"name": "Red", "hex": "#FF0000"}],
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -199,8 +199,8 @@ async def seed_database():
             "sizes": ["S", "M", "L", "XL"],
             "colors": [{"name": "Brown", "hex": "#8B4513"}, {"name": "Black", "hex": "#000000"}],
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         }
     ]
     
@@ -218,8 +218,8 @@ async def seed_database():
             "images": ["https://images.unsplash.com/photo-1505740420928-5e560c06d30e?w=400"],
             "specifications": {"Battery": "30 hours", "Connectivity": "Bluetooth 5.0", "Color": "Black"},
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -233,8 +233,8 @@ async def seed_database():
             "images": ["https://images.unsplash.com/photo-1607082349566-187342175e2f?w=400"],
             "specifications": {"Material": "Aluminum", "Adjustable": "Yes", "Color": "Silver"},
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -248,8 +248,8 @@ async def seed_database():
             "images": ["https://images.unsplash.com/photo-1591290619762-83d0e3b5f010?w=400"],
             "specifications": {"Charging Speed": "10W Fast Charge", "Compatibility": "Qi-enabled devices", "Color": "Black"},
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -263,8 +263,8 @@ async def seed_database():
             "images": ["https://images.unsplash.com/photo-1625948515291-69613efd103f?w=400"],
             "specifications": {"Ports": "7-in-1", "Compatibility": "USB-C devices", "Color": "Gray"},
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         }
     ]
     
@@ -281,8 +281,8 @@ async def seed_database():
             "seller_id": product["seller_id"],
             "quantity": 50,
             "low_stock_threshold": 10,
-            "last_restocked": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "last_restocked": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         })
     
     await db.inventory.insert_many(inventory_items)
@@ -301,7 +301,7 @@ async def seed_database():
             "phone": "9876543210",
             "is_default": True,
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -314,7 +314,7 @@ async def seed_database():
             "phone": "9876543211",
             "is_default": True,
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
     ]
     
@@ -1,13 +1,30 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, File, UploadFile
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status, File, UploadFile
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 import os
+import re
+import json
+import base64
+import gzip
+import hashlib
+import orjson
+import bisect
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from datetime import datetime, timezone, timedelta
 from passlib.context import CryptContext
@@ -15,6 +32,11 @@ from jose import JWTError, jwt
 import razorpay
 from enum import Enum
 
+try:
+    import brotli
+except ImportError:  # gzip-only compression without the optional Brotli package
+    brotli = None
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
@@ -825,11 +847,56 @@ class SupportSettingsUpdate(BaseModel):
     ticket_system_enabled: Optional[bool] = None
 
 # ============== AUTH HELPERS ==============
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+class PasswordHashPool:
+    """Dedicated thread pool so bcrypt work never blocks the event loop"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+
+    def _track(self, fn, *args):
+        with self._lock:
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    async def run(self, fn, *args):
+        with self._lock:
+            self.submitted += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._track, fn, *args)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self.submitted - self.completed
+            return {
+                "max_workers": self.max_workers,
+                "running": self.running,
+                "queue_depth": in_flight - self.running,
+                "submitted": self.submitted,
+                "completed": self.completed
+            }
+
+password_hash_pool = PasswordHashPool(
+    max_workers=int(os.environ.get("PASSWORD_HASH_WORKERS", "4"))
+)
+
+async def hash_password(password: str) -> str:
+    return await password_hash_pool.run(pwd_context.hash, password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(pwd_context.verify, plain_password, hashed_password)
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
@@ -837,6 +904,133 @@ def create_access_token(data: dict) -> str:
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+# ============== USER CACHE ==============
+class UserCache:
+    """Bounded LRU cache of authenticated user documents with a per-entry TTL"""
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 60.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, user = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return dict(user)
+
+    def set(self, user_id: str, user: Dict[str, Any]):
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, dict(user))
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: str):
+        if self._entries.pop(user_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+user_cache = UserCache(
+    max_size=int(os.environ.get("USER_CACHE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.environ.get("USER_CACHE_TTL_SECONDS", "60"))
+)
+
+def invalidate_cached_user(user_id: str):
+    """Drop a user from the auth cache after any write to their users document"""
+    user_cache.invalidate(user_id)
+
+class ConfigCache:
+    """TTL cache for storefront configuration read on every page load and invalidated on admin writes"""
+
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._dependents: Dict[str, set] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, key: str, loader, depends_on: Tuple[str, ...] = ()) -> Any:
+        """Cached value for key, calling loader() once per expiry. Values are shared and must not be mutated.
+
+        Invalidating any key in depends_on also invalidates this one.
+        """
+        for source in depends_on:
+            self._dependents.setdefault(source, set()).add(key)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            self.hits += 1
+            return entry[1]
+        # Concurrent misses for the same key wait for a single load
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            version = self._versions.get(key, 0)
+            value = await loader()
+            # An admin write that landed while we were loading makes this value stale
+            if self._versions.get(key, 0) == version:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+
+    def invalidate(self, *keys: str):
+        for key in keys:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+            if key in self._dependents:
+                self.invalidate(*self._dependents[key])
+
+    def clear(self):
+        self.invalidate(*list(self._entries))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "keys": sorted(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
+
+# Admin writes invalidate this worker immediately; other workers pick changes up within the TTL
+config_cache = ConfigCache(ttl_seconds=float(os.environ.get("CONFIG_CACHE_TTL_SECONDS", "30")))
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     try:
         token = credentials.credentials
@@ -844,9 +1038,12 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+        user = user_cache.get(user_id)
         if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
+            user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+            if user is None:
+                raise HTTPException(status_code=401, detail="User not found")
+            user_cache.set(user_id, user)
         return user
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
@@ -881,42 +1078,129 @@ def calculate_platform_fee(order_amount: float, fee_percentage: float = 2.0) ->
         "fee_percentage": fee_percentage
     }
 
-async def update_seller_performance(seller_id: str):
-    """Recalculate seller performance metrics"""
-    # Get all orders for this seller
-    orders = await db.orders.find({"items.seller_id": seller_id}).to_list(1000)
-    
-    total_orders = len(orders)
-    completed = len([o for o in orders if o.get("status") == "delivered"])
-    cancelled = len([o for o in orders if o.get("status") == "cancelled"])
-    
-    fulfillment_rate = (completed / total_orders * 100) if total_orders > 0 else 0.0
-    
-    # Get reviews for seller's products
-    seller_products = await db.products.find({"seller_id": seller_id}).to_list(1000)
-    product_ids = [p["id"] for p in seller_products]
-    reviews = await db.reviews.find({"product_id": {"$in": product_ids}}).to_list(1000)
-    
-    avg_rating = sum([r["rating"] for r in reviews]) / len(reviews) if reviews else 0.0
-    
-    # Update or create performance record
-    performance = {
-        "seller_id": seller_id,
-        "total_orders": total_orders,
-        "completed_orders": completed,
-        "cancelled_orders": cancelled,
-        "fulfillment_rate": round(fulfillment_rate, 2),
-        "rating": round(avg_rating, 2),
-        "total_reviews": len(reviews),
-        "last_calculated": datetime.now(timezone.utc)
+# Strong references to fire-and-forget jobs so they are not garbage collected mid-run
+background_tasks: set = set()
+
+def run_in_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+# ============== SELLER PERFORMANCE COUNTERS ==============
+def order_seller_ids(items: List[Any]) -> List[str]:
+    """Distinct sellers with items in an order"""
+    seller_ids = []
+    for item in items:
+        seller_id = item.get("seller_id") if isinstance(item, dict) else item.seller_id
+        if seller_id and seller_id not in seller_ids:
+            seller_ids.append(seller_id)
+    return seller_ids
+
+def performance_status_counters(status: Optional[str]) -> Dict[str, int]:
+    return {
+        "completed_orders": 1 if status == OrderStatus.DELIVERED.value else 0,
+        "cancelled_orders": 1 if status == OrderStatus.CANCELLED.value else 0
     }
-    
+
+async def record_order_performance(order: Order):
+    """Count a new order against every seller it contains"""
+    counters = {"total_orders": 1, **performance_status_counters(order.status.value)}
+    ops = [
+        UpdateOne({"seller_id": seller_id}, {"$inc": counters}, upsert=True)
+        for seller_id in order_seller_ids(order.items)
+    ]
+    if ops:
+        await db.seller_performance.bulk_write(ops, ordered=False)
+
+async def record_order_performance_status(order: Dict[str, Any], new_status: str):
+    """Move an order between the completed/cancelled counters of its sellers"""
+    old = performance_status_counters(order.get("status"))
+    new = performance_status_counters(new_status)
+    delta = {field: new[field] - old[field] for field in new if new[field] != old[field]}
+    ops = [
+        UpdateOne({"seller_id": seller_id}, {"$inc": delta}, upsert=True)
+        for seller_id in order_seller_ids(order.get("items", []))
+    ]
+    if delta and ops:
+        await db.seller_performance.bulk_write(ops, ordered=False)
+
+async def record_review_performance(product_id: str, rating: int):
+    """Fold a new review into the rating counters of the product's seller"""
+    product = await db.products.find_one({"id": product_id}, {"_id": 0, "seller_id": 1})
+    if not product or not product.get("seller_id"):
+        return
     await db.seller_performance.update_one(
-        {"seller_id": seller_id},
-        {"$set": performance},
+        {"seller_id": product["seller_id"]},
+        {"$inc": {"rating_sum": rating, "total_reviews": 1}},
         upsert=True
     )
 
+def seller_performance_view(seller_id: str, counters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Derive rates and average rating from the stored counters"""
+    counters = counters or {}
+    performance = SellerPerformance(**{**counters, "seller_id": seller_id}).model_dump()
+    total_orders = performance["total_orders"]
+    total_reviews = performance["total_reviews"]
+    performance["fulfillment_rate"] = round(performance["completed_orders"] / total_orders * 100, 2) if total_orders else 0.0
+    performance["rating"] = round(counters.get("rating_sum", 0) / total_reviews, 2) if total_reviews else 0.0
+    return performance
+
+async def update_seller_performance(seller_id: Optional[str] = None) -> int:
+    """Recompute performance counters from orders and reviews (all sellers when seller_id is None)"""
+    order_match = {"items.seller_id": seller_id} if seller_id else {}
+    order_rows = await db.orders.aggregate([
+        {"$match": order_match},
+        {"$unwind": "$items"},
+        {"$match": {"items.seller_id": seller_id} if seller_id else {"items.seller_id": {"$ne": None}}},
+        {"$group": {"_id": {"seller_id": "$items.seller_id", "order_id": "$id"}, "status": {"$first": "$status"}}},
+        {"$group": {
+            "_id": "$_id.seller_id",
+            "total_orders": {"$sum": 1},
+            "completed_orders": {"$sum": {"$cond": [{"$eq": ["$status", OrderStatus.DELIVERED.value]}, 1, 0]}},
+            "cancelled_orders": {"$sum": {"$cond": [{"$eq": ["$status", OrderStatus.CANCELLED.value]}, 1, 0]}}
+        }}
+    ], allowDiskUse=True).to_list(None)
+    
+    review_pipeline = [
+        {"$lookup": {
+            "from": "products",
+            "let": {"product_id": "$product_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$id", "$$product_id"]}}},
+                {"$project": {"_id": 0, "seller_id": 1}}
+            ],
+            "as": "product"
+        }},
+        {"$unwind": "$product"},
+        {"$group": {"_id": "$product.seller_id", "rating_sum": {"$sum": "$rating"}, "total_reviews": {"$sum": 1}}}
+    ]
+    if seller_id:
+        product_ids = await db.products.distinct("id", {"seller_id": seller_id})
+        review_pipeline.insert(0, {"$match": {"product_id": {"$in": product_ids}}})
+    review_rows = await db.reviews.aggregate(review_pipeline, allowDiskUse=True).to_list(None)
+    
+    seller_ids = [seller_id] if seller_id else await db.sellers.distinct("id")
+    counters = {
+        sid: {"total_orders": 0, "completed_orders": 0, "cancelled_orders": 0, "rating_sum": 0, "total_reviews": 0}
+        for sid in seller_ids
+    }
+    for row in order_rows + review_rows:
+        counters.setdefault(row.pop("_id"), {}).update(row)
+    
+    now = datetime.now(timezone.utc)
+    ops = [
+        UpdateOne(
+            {"seller_id": sid},
+            {"$set": {**values, "last_calculated": now}, "$unset": {"rating": "", "fulfillment_rate": ""}},
+            upsert=True
+        )
+        for sid, values in counters.items() if sid
+    ]
+    for i in range(0, len(ops), 1000):
+        await db.seller_performance.bulk_write(ops[i:i + 1000], ordered=False)
+    return len(ops)
+
 # ============== AUTH ROUTES ==============
 @api_router.post("/auth/register", response_model=Token)
 async def register(user_data: UserCreate):
@@ -928,7 +1212,7 @@ async def register(user_data: UserCreate):
     # Create user
     user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password(user_data.password),
         name=user_data.name,
         phone=user_data.phone,
         role=user_data.role
@@ -975,7 +1259,7 @@ async def login(credentials: UserLogin):
         logger.warning(f"User not found: {credentials.email}")
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
-    if not verify_password(credentials.password, user["password_hash"]):
+    if not await verify_password(credentials.password, user["password_hash"]):
         logger.warning(f"Password verification failed for: {credentials.email}")
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
@@ -1147,11 +1431,14 @@ async def reset_password(request: ResetPasswordRequest):
         raise HTTPException(status_code=400, detail="Invalid OTP")
     
     # Update password
-    new_hash = hash_password(request.new_password)
-    await db.users.update_one(
+    new_hash = await hash_password(request.new_password)
+    updated_user = await db.users.find_one_and_update(
         {"email": request.email},
-        {"$set": {"password_hash": new_hash}}
+        {"$set": {"password_hash": new_hash}},
+        projection={"_id": 0, "id": 1}
     )
+    if updated_user:
+        invalidate_cached_user(updated_user["id"])
     
     del otp_storage[otp_key]
     
@@ -1221,6 +1508,514 @@ async def approve_seller(
     
     return {"message": f"Seller {new_status.value}"}
 
+# ============== HOME FEED RANKINGS ==============
+class HomeRankings:
+    """Product rankings for the homepage rails, materialized on an interval into product_rankings"""
+
+    def __init__(self, refresh_seconds: float = 300.0, depth: int = 50):
+        self.refresh_seconds = refresh_seconds
+        self.depth = depth
+        self.rankings: Dict[str, List[str]] = {}
+        self.computed_at: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def pipelines(self) -> Dict[str, Tuple[Any, List[Dict[str, Any]]]]:
+        return {
+            "trending": (db.orders, [
+                {"$unwind": "$items"},
+                {"$group": {"_id": "$items.product_id", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$limit": self.depth}
+            ]),
+            "bestsellers": (db.orders, [
+                {"$unwind": "$items"},
+                {"$group": {"_id": "$items.product_id", "count": {"$sum": "$items.quantity"}}},
+                {"$sort": {"count": -1}},
+                {"$limit": self.depth}
+            ]),
+            "most_viewed": (db.product_view_daily, [
+                {"$group": {"_id": "$product_id", "count": {"$sum": "$count"}}},
+                {"$sort": {"count": -1}},
+                {"$limit": self.depth}
+            ])
+        }
+
+    def age_seconds(self) -> Optional[float]:
+        if self.computed_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self.computed_at).total_seconds()
+
+    async def compute(self):
+        """Run the ranking aggregations and persist the result for other workers"""
+        rankings = {}
+        for name, (collection, pipeline) in self.pipelines().items():
+            rankings[name] = [doc["_id"] async for doc in collection.aggregate(pipeline) if doc["_id"]]
+        computed_at = datetime.now(timezone.utc)
+        await db.product_rankings.bulk_write([
+            UpdateOne(
+                {"id": name},
+                {"$set": {"id": name, "product_ids": product_ids, "computed_at": computed_at}},
+                upsert=True
+            )
+            for name, product_ids in rankings.items()
+        ])
+        self.rankings = rankings
+        self.computed_at = computed_at
+
+    async def load(self):
+        """Adopt the rankings most recently persisted by any worker"""
+        docs = await db.product_rankings.find({}, {"_id": 0}).to_list(None)
+        if not docs:
+            return
+        computed_at = min(doc["computed_at"] for doc in docs)
+        if computed_at.tzinfo is None:
+            computed_at = computed_at.replace(tzinfo=timezone.utc)
+        self.rankings = {doc["id"]: doc["product_ids"] for doc in docs}
+        self.computed_at = computed_at
+
+    async def refresh(self):
+        async with self._lock:
+            await self.load()
+            age = self.age_seconds()
+            if age is None or age >= self.refresh_seconds or set(self.rankings) != set(self.pipelines()):
+                await self.compute()
+
+    async def get(self, name: str) -> List[str]:
+        if name not in self.rankings:
+            await self.refresh()
+        return self.rankings.get(name, [])
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh home feed rankings")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        age = self.age_seconds()
+        return {
+            "computed_at": self.computed_at.isoformat() if self.computed_at else None,
+            "age_seconds": round(age, 1) if age is not None else None,
+            "refresh_seconds": self.refresh_seconds,
+            "rankings": {name: len(product_ids) for name, product_ids in self.rankings.items()}
+        }
+
+home_rankings = HomeRankings(
+    refresh_seconds=float(os.environ.get("HOME_RANKINGS_REFRESH_SECONDS", "300")),
+    depth=int(os.environ.get("HOME_RANKINGS_DEPTH", "50"))
+)
+
+def set_rankings_age_header(response: Response):
+    age = home_rankings.age_seconds()
+    if age is not None:
+        response.headers["X-Rankings-Age"] = str(int(age))
+
+# ============== SEARCH SUGGESTION INDEX ==============
+class SuggestionIndex:
+    """In-memory word-prefix index over active product names and categories for autocomplete"""
+
+    CARD_FIELDS = {"_id": 0, "id": 1, "name": 1, "category": 1, "price": 1, "images": {"$slice": 1}, "view_count": 1}
+
+    def __init__(self, reload_seconds: float = 300.0):
+        self.reload_seconds = reload_seconds
+        self._products: Dict[str, Dict[str, Any]] = {}
+        self._keys: List[Tuple[str, str]] = []  # sorted (word, product_id)
+        self._categories: Dict[str, int] = {}  # category -> active product count
+        self._task: Optional[asyncio.Task] = None
+        self.loaded_at: Optional[datetime] = None
+
+    @staticmethod
+    def _words(text: str) -> List[str]:
+        return sorted(set(re.findall(r"\w+", (text or "").lower())))
+
+    def _add(self, product: Dict[str, Any], keep_sorted: bool = True):
+        """Index one product; bulk loads pass keep_sorted=False and sort the keys once at the end"""
+        card = {
+            "id": product["id"],
+            "name": product["name"],
+            "category": product.get("category"),
+            "price": product.get("price"),
+            "images": (product.get("images") or [])[:1],
+            "view_count": product.get("view_count", 0)
+        }
+        self._products[card["id"]] = card
+        for word in self._words(card["name"]):
+            if keep_sorted:
+                bisect.insort(self._keys, (word, card["id"]))
+            else:
+                self._keys.append((word, card["id"]))
+        if card["category"]:
+            self._categories[card["category"]] = self._categories.get(card["category"], 0) + 1
+
+    def remove(self, product_id: str):
+        card = self._products.pop(product_id, None)
+        if card is None:
+            return
+        for word in self._words(card["name"]):
+            i = bisect.bisect_left(self._keys, (word, product_id))
+            if i < len(self._keys) and self._keys[i] == (word, product_id):
+                del self._keys[i]
+        if card["category"] in self._categories:
+            self._categories[card["category"]] -= 1
+            if self._categories[card["category"]] <= 0:
+                del self._categories[card["category"]]
+
+    def upsert(self, product: Dict[str, Any]):
+        self.remove(product["id"])
+        if product.get("is_active", True):
+            self._add(product)
+
+    def add_views(self, counts: Dict[str, int]):
+        for product_id, count in counts.items():
+            card = self._products.get(product_id)
+            if card:
+                card["view_count"] = card.get("view_count", 0) + count
+
+    def _prefix_matches(self, prefix: str) -> set:
+        matches = set()
+        i = bisect.bisect_left(self._keys, (prefix, ""))
+        while i < len(self._keys) and self._keys[i][0].startswith(prefix):
+            matches.add(self._keys[i][1])
+            i += 1
+        return matches
+
+    def suggest(self, q: str, limit: int = 10) -> Dict[str, List[Any]]:
+        words = self._words(q)
+        if not words:
+            return {"suggestions": [], "products": []}
+        
+        # Every query word must prefix-match some word of the product name
+        product_ids = None
+        for word in words:
+            matches = self._prefix_matches(word)
+            product_ids = matches if product_ids is None else product_ids & matches
+            if not product_ids:
+                break
+        ranked = sorted(
+            (self._products[product_id] for product_id in product_ids or ()),
+            key=lambda card: card.get("view_count", 0),
+            reverse=True
+        )[:limit]
+        
+        categories = [
+            category for category in self._categories
+            if all(any(w.startswith(word) for w in self._words(category)) for word in words)
+        ]
+        categories.sort(key=lambda category: self._categories[category], reverse=True)
+        
+        return {
+            "suggestions": categories[:5],
+            "products": [{k: v for k, v in card.items() if k != "view_count"} for card in ranked]
+        }
+
+    async def load(self):
+        """Rebuild the whole index from the active catalog"""
+        products = await db.products.find({"is_active": True}, self.CARD_FIELDS).to_list(None)
+        self._products, self._keys, self._categories = {}, [], {}
+        # One sort instead of an insort per word keeps a full load O(n log n)
+        for product in products:
+            self._add(product, keep_sorted=False)
+        self._keys.sort()
+        self.loaded_at = datetime.now(timezone.utc)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.load()
+            except Exception:
+                logger.exception("Failed to load search suggestion index")
+            await asyncio.sleep(self.reload_seconds)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "products": len(self._products),
+            "keys": len(self._keys),
+            "categories": len(self._categories),
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None
+        }
+
+suggestion_index = SuggestionIndex(
+    reload_seconds=float(os.environ.get("SEARCH_SUGGESTIONS_RELOAD_SECONDS", "300"))
+)
+
+# ============== SEARCH FACET INDEX ==============
+PRICE_BUCKETS = [(0, 500), (500, 1000), (1000, 2000), (2000, 5000), (5000, None)]
+
+def price_bucket_label(price: float) -> str:
+    for low, high in PRICE_BUCKETS:
+        if high is None:
+            return f"{low}+"
+        if price < high:
+            return f"{low}-{high}"
+
+def price_bucket_query(label: str) -> Dict[str, Any]:
+    try:
+        if label.endswith("+"):
+            return {"price": {"$gte": float(label[:-1])}}
+        low, high = label.split("-")
+        return {"price": {"$gte": float(low), "$lt": float(high)}}
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid price bucket: {label}")
+
+def split_csv(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()] if value else []
+
+class FacetIndex:
+    """In-memory facet postings over active products, kept current on product writes"""
+
+    FACETS = ("category", "brand", "size", "color", "price")
+    FIELDS = {"_id": 0, "id": 1, "category": 1, "price": 1, "filters": 1, "sizes": 1, "colors": 1}
+
+    def __init__(self, reload_seconds: float = 300.0):
+        self.reload_seconds = reload_seconds
+        self._postings: Dict[str, Dict[str, set]] = {facet: {} for facet in self.FACETS}
+        self._products: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.loaded_at: Optional[datetime] = None
+
+    @staticmethod
+    def facet_values(product: Dict[str, Any]) -> Dict[str, List[str]]:
+        filters = product.get("filters") or {}
+        brand = filters.get("brand", filters.get("Brand"))
+        brands = brand if isinstance(brand, list) else [brand] if brand else []
+        return {
+            "category": [product["category"]] if product.get("category") else [],
+            "brand": [str(b) for b in brands],
+            "size": list(dict.fromkeys(product.get("sizes") or [])),
+            "color": list(dict.fromkeys(c["name"] for c in product.get("colors") or [] if c.get("name"))),
+            "price": [price_bucket_label(product.get("price", 0))]
+        }
+
+    def _add(self, product: Dict[str, Any]):
+        entry = self.facet_values(product)
+        entry["_price"] = product.get("price", 0)
+        self._products[product["id"]] = entry
+        for facet in self.FACETS:
+            for value in entry[facet]:
+                self._postings[facet].setdefault(value, set()).add(product["id"])
+
+    def remove(self, product_id: str):
+        entry = self._products.pop(product_id, None)
+        if entry is None:
+            return
+        for facet in self.FACETS:
+            for value in entry[facet]:
+                ids = self._postings[facet].get(value)
+                if ids is not None:
+                    ids.discard(product_id)
+                    if not ids:
+                        del self._postings[facet][value]
+
+    def upsert(self, product: Dict[str, Any]):
+        self.remove(product["id"])
+        if product.get("is_active", True):
+            self._add(product)
+
+    def candidates(self, category: Optional[str], min_price: Optional[float], max_price: Optional[float]) -> Optional[set]:
+        """Products passing the non-facet filters of /search, or None when there are none"""
+        if not category and min_price is None and max_price is None:
+            return None
+        category = category.lower() if category else None
+        return {
+            product_id for product_id, entry in self._products.items()
+            if (not category or any(category in c.lower() for c in entry["category"]))
+            and (min_price is None or entry["_price"] >= min_price)
+            and (max_price is None or entry["_price"] <= max_price)
+        }
+
+    def _matching(self, selected: Dict[str, List[str]], exclude: Optional[str] = None) -> Optional[set]:
+        result = None
+        for facet, values in selected.items():
+            if facet == exclude or not values:
+                continue
+            ids = set().union(*(self._postings[facet].get(value, set()) for value in values))
+            result = ids if result is None else result & ids
+        return result
+
+    def counts(self, selected: Dict[str, List[str]], candidates: Optional[set] = None) -> Dict[str, Dict[str, int]]:
+        """Hit counts per facet value; each facet ignores its own selection so siblings stay visible"""
+        facets = {}
+        for facet in self.FACETS:
+            base = self._matching(selected, exclude=facet)
+            if candidates is not None:
+                base = candidates if base is None else base & candidates
+            if base is None:
+                counts = {value: len(ids) for value, ids in self._postings[facet].items()}
+            else:
+                counts = {}
+                for product_id in base:
+                    for value in self._products.get(product_id, {}).get(facet, []):
+                        counts[value] = counts.get(value, 0) + 1
+            facets[facet] = dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+        return facets
+
+    async def load(self):
+        """Rebuild all postings from the active catalog"""
+        products = await db.products.find({"is_active": True}, self.FIELDS).to_list(None)
+        self._postings = {facet: {} for facet in self.FACETS}
+        self._products = {}
+        for product in products:
+            self._add(product)
+        self.loaded_at = datetime.now(timezone.utc)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.load()
+            except Exception:
+                logger.exception("Failed to load search facet index")
+            await asyncio.sleep(self.reload_seconds)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "products": len(self._products),
+            "values": {facet: len(values) for facet, values in self._postings.items()},
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None
+        }
+
+facet_index = FacetIndex(
+    reload_seconds=float(os.environ.get("SEARCH_FACETS_RELOAD_SECONDS", "300"))
+)
+FACET_TEXT_CANDIDATES = int(os.environ.get("SEARCH_FACET_TEXT_CANDIDATES", "5000"))
+
+def index_product(product: Dict[str, Any]):
+    """Apply a product write to the in-memory search indexes"""
+    suggestion_index.upsert(product)
+    facet_index.upsert(product)
+
+def unindex_product(product_id: str):
+    suggestion_index.remove(product_id)
+    facet_index.remove(product_id)
+
+# ============== PAGINATION ==============
+MAX_PAGE_SIZE = int(os.environ.get("MAX_PAGE_SIZE", "200"))
+
+def _cursor_default(value: Any):
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+def _cursor_hook(obj: Dict[str, Any]):
+    if set(obj) == {"$date"}:
+        return datetime.fromisoformat(obj["$date"])
+    return obj
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """Opaque page cursor: urlsafe base64 of the JSON position"""
+    return base64.urlsafe_b64encode(json.dumps(data, default=_cursor_default).encode()).decode()
+
+CURSOR_VALUE_TYPES = (str, int, float, bool, datetime, type(None))
+
+def valid_cursor(data: Any) -> bool:
+    """An offset cursor {"skip"} or a keyset cursor {"v", "id"}; values are never query operators"""
+    if not isinstance(data, dict):
+        return False
+    if set(data) == {"skip"}:
+        skip = data["skip"]
+        return isinstance(skip, int) and not isinstance(skip, bool) and skip >= 0
+    if set(data) == {"v", "id"}:
+        return isinstance(data["v"], CURSOR_VALUE_TYPES) and isinstance(data["id"], str)
+    return False
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()), object_hook=_cursor_hook)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not valid_cursor(data):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return data
+
+def page_size(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+def keyset_filter(sort_key: str, direction: int, after: Dict[str, Any]) -> Dict[str, Any]:
+    """Match documents strictly after the cursor position in (sort_key, id) order"""
+    if "id" not in after:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    op = "$lt" if direction < 0 else "$gt"
+    return {"$or": [
+        {sort_key: {op: after["v"]}},
+        {sort_key: after["v"], "id": {op: after["id"]}}
+    ]}
+
+def keyset_next_cursor(docs: List[Dict[str, Any]], sort_key: str, limit: int) -> Optional[str]:
+    if len(docs) < limit:
+        return None
+    return encode_cursor({"v": docs[-1].get(sort_key), "id": docs[-1]["id"]})
+
+def set_next_cursor_header(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+# ============== FAST JSON RESPONSES ==============
+class FastJSONResponse(JSONResponse):
+    """JSON rendered with orjson, for handlers that return stored documents without response_model validation"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+def model_projection(model: type) -> Dict[str, Any]:
+    """Mongo projection returning exactly the fields a response_model would keep"""
+    return {"_id": 0, **{name: 1 for name in model.model_fields}}
+
+def model_defaults(model: type) -> Dict[str, Any]:
+    """Static field defaults, filled into stored documents in place of response_model validation"""
+    return {
+        name: field.default for name, field in model.model_fields.items()
+        if not field.is_required() and field.default_factory is None
+    }
+
+PRODUCT_DEFAULTS = model_defaults(Product)
+ORDER_DEFAULTS = model_defaults(Order)
+REVIEW_DEFAULTS = model_defaults(Review)
+
+def trusted_documents(documents: List[Dict[str, Any]], defaults: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Documents we wrote through the models: only missing defaults need filling, not re-validation"""
+    return [{**defaults, **document} for document in documents]
+
+# ============== FIELD PROJECTION ==============
+PRODUCT_CARD_FIELDS = ["id", "name", "price", "mrp", "category", "seller_id", "images"]
+
+def product_projection(fields: Optional[str], *required: str) -> Dict[str, Any]:
+    """Mongo projection for a fields= parameter: "card", a comma-separated list, or everything"""
+    if not fields:
+        # Model fields only, so internal bookkeeping like inventory reservations never leaks
+        return model_projection(Product)
+    names = PRODUCT_CARD_FIELDS if fields == "card" else split_csv(fields)
+    unknown = [name for name in names if name not in Product.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown product fields: {', '.join(unknown)}")
+    projection = {"_id": 0, "id": 1, **{name: 1 for name in names}, **{name: 1 for name in required}}
+    if fields == "card":
+        # Grid cards only render the first image
+        projection["images"] = {"$slice": 1}
+    return projection
+
 # ============== PRODUCT ROUTES ==============
 @api_router.post("/products", response_model=Product)
 async def create_product(
@@ -1238,6 +2033,7 @@ async def create_product(
     )
     
     await db.products.insert_one(product.model_dump())
+    index_product(product.model_dump())
     
     # Initialize inventory
     inventory = Inventory(
@@ -1249,38 +2045,49 @@ async def create_product(
     
     return product
 
+# Trusted documents skip response_model validation; the model still documents the schema
 @api_router.get("/products", response_model=List[Product])
-async def get_products(category: Optional[str] = None, seller_id: Optional[str] = None):
+async def get_products(
+    category: Optional[str] = None,
+    seller_id: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
     query = {"is_active": True}
     if category:
         query["category"] = category
     if seller_id:
         query["seller_id"] = seller_id
     
-    products = await db.products.find(query, {"_id": 0}).to_list(1000)
-    return products
-
-@api_router.get("/products/trending")
-async def get_trending_products(limit: int = 10):
-    # First try to get products with most orders
-    pipeline = [
-        {"$unwind": "$items"},
-        {"$group": {"_id": "$items.product_id", "count": {"$sum": 1}}},
-        {"$sort": {"count": -1}},
-        {"$limit": limit}
-    ]
-    
-    trending_ids = []
-    async for doc in db.orders.aggregate(pipeline):
-        trending_ids.append(doc["_id"])
+    # Keyset pagination over (created_at, id), newest first; next page cursor goes in X-Next-Cursor
+    limit = page_size(limit)
+    if cursor:
+        query.update(keyset_filter("created_at", -1, decode_cursor(cursor)))
     
-    products = []
-    for product_id in trending_ids:
-        product = await db.products.find_one({"id": product_id, "is_active": True}, {"_id": 0})
-        if product:
-            products.append(product)
-    
-    # If not enough products from orders, fill with random active products
+    products = await db.products.find(query, product_projection(fields, "created_at")).sort(
+        [("created_at", -1), ("id", -1)]
+    ).limit(limit).to_list(limit)
+    next_cursor = keyset_next_cursor(products, "created_at", limit)
+    # Sparse documents are returned as requested, full ones get missing model defaults
+    fast = FastJSONResponse(products if fields else trusted_documents(products, PRODUCT_DEFAULTS))
+    set_next_cursor_header(fast, next_cursor)
+    return fast
+
+async def get_active_products_ranked(product_ids: List[str]) -> List[Dict[str, Any]]:
+    """Fetch active products for ranked ids in one query, preserving the ranking order"""
+    if not product_ids:
+        return []
+    found = {}
+    async for product in db.products.find({"id": {"$in": product_ids}, "is_active": True}, {"_id": 0}):
+        found[product["id"]] = product
+    return [found[product_id] for product_id in product_ids if product_id in found]
+
+async def get_ranked_products(name: str, limit: int) -> List[Dict[str, Any]]:
+    """Top products of a home ranking snapshot, topped up with the newest active products"""
+    products = await get_active_products_ranked((await home_rankings.get(name))[:limit])
+    
+    # If not enough ranked products, fill with the newest active products
     if len(products) < limit:
         additional = await db.products.find(
             {"is_active": True, "id": {"$nin": [p["id"] for p in products]}},
@@ -1290,24 +2097,29 @@ async def get_trending_products(limit: int = 10):
     
     return products
 
+@api_router.get("/products/trending")
+async def get_trending_products(response: Response, limit: int = 10):
+    # Products with most orders, from the periodically refreshed snapshot
+    set_rankings_age_header(response)
+    return await get_ranked_products("trending", limit)
+
 @api_router.get("/products/most-viewed")
-async def get_most_viewed_products(limit: int = 10):
-    # Get products with most views
-    pipeline = [
-        {"$group": {"_id": "$product_id", "count": {"$sum": 1}}},
-        {"$sort": {"count": -1}},
-        {"$limit": limit}
-    ]
-    
-    most_viewed_ids = []
-    async for doc in db.product_views.aggregate(pipeline):
-        most_viewed_ids.append(doc["_id"])
+async def get_most_viewed_products(response: Response, limit: int = 10, days: Optional[int] = None):
+    if days:
+        # Products with most views in the last N days, summed from the daily rollup
+        pipeline = [
+            {"$match": {"day": {"$gte": product_view_window_start(days)}}},
+            {"$group": {"_id": "$product_id", "count": {"$sum": "$count"}}},
+            {"$sort": {"count": -1}},
+            {"$limit": limit}
+        ]
+        most_viewed_ids = [doc["_id"] async for doc in db.product_view_daily.aggregate(pipeline)]
+    else:
+        # All-time most viewed products, from the periodically refreshed snapshot
+        set_rankings_age_header(response)
+        return await get_ranked_products("most_viewed", limit)
     
-    products = []
-    for product_id in most_viewed_ids:
-        product = await db.products.find_one({"id": product_id, "is_active": True}, {"_id": 0})
-        if product:
-            products.append(product)
+    products = await get_active_products_ranked(most_viewed_ids)
     
     # If not enough viewed products, fill with random active products
     if len(products) < limit:
@@ -1320,8 +2132,8 @@ async def get_most_viewed_products(limit: int = 10):
     return products
 
 @api_router.get("/products/similar/{product_id}")
-async def get_similar_products(product_id: str, limit: int = 8):
-    product = await db.products.find_one({"id": product_id}, {"_id": 0})
+async def get_similar_products(product_id: str, limit: int = 8, fields: Optional[str] = None):
+    product = await db.products.find_one({"id": product_id}, {"_id": 0, "category": 1})
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
@@ -1332,7 +2144,7 @@ async def get_similar_products(product_id: str, limit: int = 8):
             "is_active": True,
             "id": {"$ne": product_id}
         },
-        {"_id": 0}
+        product_projection(fields)
     ).limit(limit).to_list(limit)
     
     return similar
@@ -1362,6 +2174,7 @@ async def update_product(
     )
     
     updated = await db.products.find_one({"id": product_id}, {"_id": 0})
+    index_product(updated)
     return updated
 
 @api_router.delete("/products/{product_id}")
@@ -1376,6 +2189,7 @@ async def delete_product(
         raise HTTPException(status_code=403, detail="Not authorized")
     
     await db.products.update_one({"id": product_id}, {"$set": {"is_active": False}})
+    unindex_product(product_id)
     return {"message": "Product deleted"}
 
 # ============== INVENTORY ROUTES ==============
@@ -1418,18 +2232,144 @@ async def update_inventory(
     
     return {"message": "Inventory updated"}
 
+# ============== REVENUE ROLLUPS ==============
+# Platform-wide rows share the (day, seller_id) key with seller rows; $merge rejects a null key
+PLATFORM_ROLLUP = "__platform__"
+
+def rollup_day(value: Any) -> str:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.strftime("%Y-%m-%d")
+
+async def record_order_rollups(order: Order, fees: List[Dict[str, Any]]):
+    """Fold a new order and its platform fees into the per-day revenue rollups"""
+    day = rollup_day(order.created_at)
+    ops = [UpdateOne(
+        {"day": day, "seller_id": PLATFORM_ROLLUP},
+        {"$inc": {
+            "orders": 1,
+            "total_amount": order.total_amount,
+            "platform_fee": sum(fee["fee_amount"] for fee in fees),
+            f"status.{order.status.value}": 1
+        }},
+        upsert=True
+    )]
+    for fee in fees:
+        ops.append(UpdateOne(
+            {"day": day, "seller_id": fee["seller_id"]},
+            {"$inc": {
+                "orders": 1,
+                "gross_revenue": fee["order_amount"],
+                "platform_fee": fee["fee_amount"],
+                "seller_payout": fee["seller_payout"]
+            }},
+            upsert=True
+        ))
+    await db.revenue_rollups.bulk_write(ops, ordered=False)
+
+async def record_order_status_change(order: Dict[str, Any], new_status: str):
+    """Move an order between status counters on the rollup for the day it was placed"""
+    old_status = order.get("status")
+    if old_status == new_status:
+        return
+    await db.revenue_rollups.update_one(
+        {"day": rollup_day(order["created_at"]), "seller_id": PLATFORM_ROLLUP},
+        {"$inc": {f"status.{old_status}": -1, f"status.{new_status}": 1}},
+        upsert=True
+    )
+
+async def rebuild_revenue_rollups():
+    """Recompute revenue_rollups from orders and platform_fees"""
+    # $toDate accepts both BSON dates and the ISO strings older documents were written with
+    day = {"$dateToString": {"format": "%Y-%m-%d", "date": {"$toDate": "$created_at"}}}
+    platform = {"$literal": PLATFORM_ROLLUP}
+    merge = {"into": "revenue_rollups", "on": ["day", "seller_id"], "whenMatched": "merge"}
+    await db.revenue_rollups.delete_many({})
+    await db.orders.aggregate([
+        {"$group": {"_id": day, "orders": {"$sum": 1}, "total_amount": {"$sum": "$total_amount"}}},
+        {"$project": {"_id": 0, "day": "$_id", "seller_id": platform, "orders": 1, "total_amount": 1}},
+        {"$merge": merge}
+    ]).to_list(None)
+    await db.orders.aggregate([
+        {"$group": {"_id": {"day": day, "status": "$status"}, "count": {"$sum": 1}}},
+        {"$group": {"_id": "$_id.day", "status": {"$push": {"k": "$_id.status", "v": "$count"}}}},
+        {"$project": {"_id": 0, "day": "$_id", "seller_id": platform, "status": {"$arrayToObject": "$status"}}},
+        {"$merge": merge}
+    ]).to_list(None)
+    await db.platform_fees.aggregate([
+        {"$group": {"_id": day, "platform_fee": {"$sum": "$fee_amount"}}},
+        {"$project": {"_id": 0, "day": "$_id", "seller_id": platform, "platform_fee": 1}},
+        {"$merge": merge}
+    ]).to_list(None)
+    await db.platform_fees.aggregate([
+        {"$match": {"seller_id": {"$type": "string"}}},
+        {"$group": {
+            "_id": {"day": day, "seller_id": "$seller_id"},
+            "orders": {"$sum": 1},
+            "gross_revenue": {"$sum": "$order_amount"},
+            "platform_fee": {"$sum": "$fee_amount"},
+            "seller_payout": {"$sum": "$seller_payout"}
+        }},
+        {"$project": {
+            "_id": 0, "day": "$_id.day", "seller_id": "$_id.seller_id",
+            "orders": 1, "gross_revenue": 1, "platform_fee": 1, "seller_payout": 1
+        }},
+        {"$merge": merge}
+    ]).to_list(None)
+
 # ============== ORDER ROUTES ==============
+async def reserve_inventory(items: List[Dict[str, Any]], reservation_id: str):
+    """Decrement stock for every cart item in one guarded bulk write, or for none of them"""
+    quantities: Dict[str, int] = {}
+    names: Dict[str, str] = {}
+    for item in items:
+        quantities[item["product_id"]] = quantities.get(item["product_id"], 0) + item["quantity"]
+        names.setdefault(item["product_id"], item.get("name", item["product_id"]))
+    product_ids = list(quantities)
+    if not product_ids:
+        return
+    
+    # Verify inventory in a single read so the customer gets a precise error
+    stock = {}
+    async for inventory in db.inventory.find(
+        {"product_id": {"$in": product_ids}},
+        {"_id": 0, "product_id": 1, "quantity": 1}
+    ):
+        stock[inventory["product_id"]] = inventory["quantity"]
+    for product_id, quantity in quantities.items():
+        if stock.get(product_id, 0) < quantity:
+            raise HTTPException(status_code=400, detail=f"Insufficient stock for {names[product_id]}")
+    
+    # Each decrement only applies while enough stock remains, so concurrent orders cannot oversell
+    result = await db.inventory.bulk_write([
+        UpdateOne(
+            {"product_id": product_id, "quantity": {"$gte": quantity}},
+            {"$inc": {"quantity": -quantity}, "$addToSet": {"reservations": reservation_id}}
+        )
+        for product_id, quantity in quantities.items()
+    ], ordered=False)
+    
+    if result.modified_count < len(quantities):
+        # Another order took the last units of some item - give back everything we reserved
+        await db.inventory.bulk_write([
+            UpdateOne(
+                {"product_id": product_id, "reservations": reservation_id},
+                {"$inc": {"quantity": quantity}, "$pull": {"reservations": reservation_id}}
+            )
+            for product_id, quantity in quantities.items()
+        ], ordered=False)
+        raise HTTPException(status_code=400, detail="Some items in your cart just went out of stock")
+    
+    await db.inventory.update_many(
+        {"product_id": {"$in": product_ids}, "reservations": reservation_id},
+        {"$pull": {"reservations": reservation_id}}
+    )
+
 @api_router.post("/orders", response_model=Order)
 async def create_order(
     order_data: OrderCreate,
     user: Dict[str, Any] = Depends(require_role([UserRole.CUSTOMER]))
 ):
-    # Verify inventory
-    for item in order_data.items:
-        inventory = await db.inventory.find_one({"product_id": item["product_id"]})
-        if not inventory or inventory["quantity"] < item["quantity"]:
-            raise HTTPException(status_code=400, detail=f"Insufficient stock for {item['name']}")
-    
     # Calculate platform fee (2% of total amount)
     fee_calculation = calculate_platform_fee(order_data.total_amount, 2.0)
     
@@ -1441,14 +2381,10 @@ async def create_order(
         **order_data.model_dump()
     )
     
-    await db.orders.insert_one(order.model_dump())
+    # Reserve inventory before the order exists so a failed reservation leaves nothing behind
+    await reserve_inventory(order_data.items, order.id)
     
-    # Update inventory
-    for item in order_data.items:
-        await db.inventory.update_one(
-            {"product_id": item["product_id"]},
-            {"$inc": {"quantity": -item["quantity"]}}
-        )
+    await db.orders.insert_one(order.model_dump())
     
     # Group items by seller and create platform fee records
     seller_items = {}
@@ -1458,6 +2394,16 @@ async def create_order(
             seller_items[seller_id] = []
         seller_items[seller_id].append(item)
     
+    sellers = {}
+    async for seller in db.sellers.find(
+        {"id": {"$in": list(seller_items)}},
+        {"_id": 0, "id": 1, "user_id": 1}
+    ):
+        sellers[seller["id"]] = seller
+    
+    # Collect fee records and notifications so the fan-out is two writes regardless of seller count
+    fees_to_insert = []
+    notifications_to_insert = []
     for seller_id, items in seller_items.items():
         # Calculate seller-specific order amount
         seller_order_amount = sum([item["price"] * item["quantity"] for item in items])
@@ -1473,17 +2419,17 @@ async def create_order(
             seller_payout=seller_fee_calc["seller_payout"],
             status="pending"
         )
-        await db.platform_fees.insert_one(platform_fee.model_dump())
+        fees_to_insert.append(platform_fee.model_dump())
         
         # Notify seller
-        seller = await db.sellers.find_one({"id": seller_id})
+        seller = sellers[seller_id]
         notification = Notification(
             user_id=seller["user_id"],
             title="New Order Received",
             message=f"Order #{order.id} - {len(items)} items | Payout: ₹{seller_fee_calc['seller_payout']} (After 2% platform fee)",
             type="order_update"
         )
-        await db.notifications.insert_one(notification.model_dump())
+        notifications_to_insert.append(notification.model_dump())
     
     # Notify customer
     customer_notification = Notification(
@@ -1492,24 +2438,34 @@ async def create_order(
         message=f"Your order #{order.id} has been placed successfully",
         type="order_update"
     )
-    await db.notifications.insert_one(customer_notification.model_dump())
+    notifications_to_insert.append(customer_notification.model_dump())
+    
+    writes = [
+        db.notifications.insert_many(notifications_to_insert, ordered=False),
+        record_order_rollups(order, fees_to_insert),
+        record_order_performance(order)
+    ]
+    if fees_to_insert:
+        writes.append(db.platform_fees.insert_many(fees_to_insert, ordered=False))
+    await asyncio.gather(*writes)
     
     return order
 
 @api_router.get("/orders/my", response_model=List[Order])
 async def get_my_orders(user: Dict[str, Any] = Depends(get_current_user)):
+    projection = model_projection(Order)
     if user["role"] == UserRole.CUSTOMER.value:
-        orders = await db.orders.find({"customer_id": user["id"]}, {"_id": 0}).to_list(1000)
+        orders = await db.orders.find({"customer_id": user["id"]}, projection).to_list(1000)
     elif user["role"] == UserRole.SELLER.value:
         seller = await db.sellers.find_one({"user_id": user["id"]})
         orders = await db.orders.find(
             {"items.seller_id": seller["id"]},
-            {"_id": 0}
+            projection
         ).to_list(1000)
     else:  # Admin
-        orders = await db.orders.find({}, {"_id": 0}).to_list(1000)
+        orders = await db.orders.find({}, projection).to_list(1000)
     
-    return orders
+    return FastJSONResponse(trusted_documents(orders, ORDER_DEFAULTS))
 
 @api_router.get("/orders/{order_id}", response_model=Order)
 async def get_order(order_id: str, user: Dict[str, Any] = Depends(get_current_user)):
@@ -1529,13 +2485,18 @@ async def update_order_status(
     status: OrderStatus,
     user: Dict[str, Any] = Depends(require_role([UserRole.SELLER, UserRole.ADMIN]))
 ):
-    order = await db.orders.find_one({"id": order_id})
+    # The pre-update document tells us exactly which status this write replaced
+    order = await db.orders.find_one_and_update(
+        {"id": order_id},
+        {"$set": {"status": status.value, "updated_at": datetime.now(timezone.utc).isoformat()}},
+        projection={"_id": 0}
+    )
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    await db.orders.update_one(
-        {"id": order_id},
-        {"$set": {"status": status.value, "updated_at": datetime.now(timezone.utc).isoformat()}}
+    await asyncio.gather(
+        record_order_status_change(order, status.value),
+        record_order_performance_status(order, status.value)
     )
     
     # Notify customer
@@ -1550,6 +2511,42 @@ async def update_order_status(
     return {"message": "Order status updated"}
 
 # ============== REVIEW ROUTES ==============
+async def record_review_stats(review: Review):
+    """Fold a new review into its product's running count, sum and histogram"""
+    await db.review_stats.update_one(
+        {"product_id": review.product_id},
+        {"$inc": {
+            "count": 1,
+            "sum": review.rating,
+            f"histogram.{review.rating}": 1,
+            "with_photos": 1 if review.images else 0
+        }},
+        upsert=True
+    )
+
+async def rebuild_review_stats():
+    """Recompute review_stats from reviews"""
+    await db.review_stats.delete_many({})
+    await db.reviews.aggregate([
+        {"$group": {
+            "_id": {"product_id": "$product_id", "rating": "$rating"},
+            "count": {"$sum": 1},
+            "with_photos": {"$sum": {"$cond": [{"$gt": [{"$size": {"$ifNull": ["$images", []]}}, 0]}, 1, 0]}}
+        }},
+        {"$group": {
+            "_id": "$_id.product_id",
+            "count": {"$sum": "$count"},
+            "sum": {"$sum": {"$multiply": ["$_id.rating", "$count"]}},
+            "with_photos": {"$sum": "$with_photos"},
+            "histogram": {"$push": {"k": {"$toString": "$_id.rating"}, "v": "$count"}}
+        }},
+        {"$project": {
+            "_id": 0, "product_id": "$_id", "count": 1, "sum": 1, "with_photos": 1,
+            "histogram": {"$arrayToObject": "$histogram"}
+        }},
+        {"$merge": {"into": "review_stats", "on": "product_id", "whenMatched": "replace"}}
+    ], allowDiskUse=True).to_list(None)
+
 @api_router.post("/reviews", response_model=Review)
 async def create_review(
     review_data: ReviewCreate,
@@ -1567,12 +2564,16 @@ async def create_review(
     )
     
     await db.reviews.insert_one(review.model_dump())
+    await asyncio.gather(
+        record_review_stats(review),
+        record_review_performance(review.product_id, review.rating)
+    )
     return review
 
 @api_router.get("/reviews/product/{product_id}", response_model=List[Review])
 async def get_product_reviews(product_id: str):
-    reviews = await db.reviews.find({"product_id": product_id}, {"_id": 0}).to_list(1000)
-    return reviews
+    reviews = await db.reviews.find({"product_id": product_id}, model_projection(Review)).to_list(1000)
+    return FastJSONResponse(trusted_documents(reviews, REVIEW_DEFAULTS))
 
 # ============== NOTIFICATION ROUTES ==============
 @api_router.get("/notifications/my", response_model=List[Notification])
@@ -1656,51 +2657,96 @@ async def get_my_tickets(user: Dict[str, Any] = Depends(get_current_user)):
     return tickets
 
 # ============== ANALYTICS ROUTES ==============
+ANALYTICS_PERIODS = {
+    # period: (bucket format for $dateToString, how far back the time series goes)
+    "daily": ("%Y-%m-%d", timedelta(days=30)),
+    "weekly": ("%G-W%V", timedelta(weeks=26)),
+    "monthly": ("%Y-%m", timedelta(days=730)),
+    "yearly": ("%Y", None)
+}
+
 @api_router.get("/analytics/seller")
 async def get_seller_analytics(
     period: str = "monthly",  # daily, weekly, monthly, yearly
     user: Dict[str, Any] = Depends(require_role([UserRole.SELLER]))
 ):
-    seller = await db.sellers.find_one({"user_id": user["id"]})
+    if period not in ANALYTICS_PERIODS:
+        raise HTTPException(status_code=400, detail=f"Invalid period. Use one of: {', '.join(ANALYTICS_PERIODS)}")
+    bucket_format, window = ANALYTICS_PERIODS[period]
     
-    # Get orders for this seller
-    orders = await db.orders.find({"items.seller_id": seller["id"]}).to_list(10000)
+    seller = await db.sellers.find_one({"user_id": user["id"]})
+    seller_id = seller["id"]
+    
+    # Revenue of each order counts only this seller's line items
+    seller_revenue = {"$sum": {"$map": {
+        "input": {"$filter": {"input": "$items", "cond": {"$eq": ["$$this.seller_id", seller_id]}}},
+        "in": {"$multiply": ["$$this.price", "$$this.quantity"]}
+    }}}
+    series_match = [{"$match": {"created_at": {"$gte": datetime.now(timezone.utc) - window}}}] if window else []
+    pipeline = [
+        {"$match": {"items.seller_id": seller_id}},
+        {"$project": {"_id": 0, "status": 1, "created_at": 1, "revenue": seller_revenue}},
+        {"$facet": {
+            "totals": [
+                {"$group": {"_id": None, "revenue": {"$sum": "$revenue"}, "orders": {"$sum": 1}}}
+            ],
+            "series": series_match + [
+                {"$group": {
+                    "_id": {"$dateToString": {"format": bucket_format, "date": "$created_at"}},
+                    "revenue": {"$sum": "$revenue"},
+                    "orders": {"$sum": 1}
+                }},
+                {"$sort": {"_id": 1}},
+                {"$project": {"_id": 0, "bucket": "$_id", "revenue": 1, "orders": 1}}
+            ],
+            "status": [
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+            ]
+        }}
+    ]
     
-    # Calculate analytics
-    total_revenue = sum(
-        sum(item["price"] * item["quantity"] for item in order["items"] if item["seller_id"] == seller["id"])
-        for order in orders
-    )
-    total_orders = len(orders)
+    aggregate = db.orders.aggregate(pipeline).to_list(1)
+    recent_orders = db.orders.find(
+        {"items.seller_id": seller_id},
+        {"_id": 0}
+    ).sort("created_at", -1).limit(10).to_list(10)
+    active_products = db.products.count_documents({"seller_id": seller_id, "is_active": True})
+    (result,), orders, active_count = await asyncio.gather(aggregate, recent_orders, active_products)
     
-    # Get product stats
-    products = await db.products.find({"seller_id": seller["id"]}).to_list(1000)
-    active_products = len([p for p in products if p.get("is_active", True)])
+    totals = result["totals"][0] if result["totals"] else {"revenue": 0, "orders": 0}
     
     return {
         "period": period,
-        "total_revenue": total_revenue,
-        "total_orders": total_orders,
-        "active_products": active_products,
+        "total_revenue": totals["revenue"],
+        "total_orders": totals["orders"],
+        "active_products": active_count,
+        "time_series": result["series"],
+        "status_breakdown": {doc["_id"]: doc["count"] for doc in result["status"]},
         "orders": orders
     }
 
 @api_router.get("/analytics/admin")
 async def get_admin_analytics(user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
     # Platform KPIs
-    total_users = await db.users.count_documents({})
-    total_sellers = await db.sellers.count_documents({})
-    pending_sellers = await db.sellers.count_documents({"status": SellerStatus.PENDING.value})
-    total_products = await db.products.count_documents({"is_active": True})
-    total_orders = await db.orders.count_documents({})
-    
-    # Revenue
-    orders = await db.orders.find({}).to_list(10000)
-    total_revenue = sum(order["total_amount"] for order in orders)
-    
-    # Platform fee collected
-    platform_fees = await db.platform_fees.find({}).to_list(10000)
-    total_platform_fee = sum(fee.get("fee_amount", 0) for fee in platform_fees)
+    (
+        total_users, total_sellers, pending_sellers, total_products, total_orders, revenue
+    ) = await asyncio.gather(
+        db.users.count_documents({}),
+        db.sellers.count_documents({}),
+        db.sellers.count_documents({"status": SellerStatus.PENDING.value}),
+        db.products.count_documents({"is_active": True}),
+        db.orders.count_documents({}),
+        # Revenue and platform fee collected, summed over the per-day platform rollups
+        db.revenue_rollups.aggregate([
+            {"$match": {"seller_id": PLATFORM_ROLLUP}},
+            {"$group": {
+                "_id": None,
+                "total_revenue": {"$sum": "$total_amount"},
+                "total_platform_fee": {"$sum": "$platform_fee"}
+            }}
+        ]).to_list(1)
+    )
+    totals = revenue[0] if revenue else {"total_revenue": 0, "total_platform_fee": 0}
     
     return {
         "total_users": total_users,
@@ -1708,67 +2754,118 @@ async def get_admin_analytics(user: Dict[str, Any] = Depends(require_role([UserR
         "pending_sellers": pending_sellers,
         "total_products": total_products,
         "total_orders": total_orders,
-        "total_revenue": total_revenue,
-        "total_platform_fee": total_platform_fee
+        "total_revenue": totals["total_revenue"],
+        "total_platform_fee": totals["total_platform_fee"]
     }
 
+SELLER_REVENUE_SORT_FIELDS = {
+    "gross_revenue", "net_revenue", "platform_fee", "total_paid", "pending_payout", "total_orders", "business_name"
+}
+
 @api_router.get("/analytics/admin/seller-revenue")
-async def get_seller_wise_revenue(user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
+async def get_seller_wise_revenue(
+    sort: str = "gross_revenue",
+    order: str = "desc",
+    skip: int = 0,
+    limit: int = 100,
+    user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))
+):
     """Get seller-wise revenue breakdown for admin analytics"""
-    # Get all sellers
-    sellers = await db.sellers.find({}, {"_id": 0}).to_list(1000)
+    if sort not in SELLER_REVENUE_SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Invalid sort. Use one of: {', '.join(sorted(SELLER_REVENUE_SORT_FIELDS))}")
+    direction = 1 if order == "asc" else -1
+    limit = page_size(limit)
     
-    seller_revenue = []
-    for seller in sellers:
-        # Get user info for seller name
-        seller_user = await db.users.find_one({"id": seller["user_id"]}, {"_id": 0})
-        
-        # Get platform fees for this seller
-        fees = await db.platform_fees.find({"seller_id": seller["id"]}, {"_id": 0}).to_list(1000)
-        
-        total_orders = len(fees)
-        gross_revenue = sum(fee.get("order_amount", 0) for fee in fees)
-        platform_fee = sum(fee.get("fee_amount", 0) for fee in fees)
-        net_revenue = sum(fee.get("seller_payout", 0) for fee in fees)
-        
-        # Get payouts
-        payouts = await db.seller_payouts.find({"seller_id": seller["id"]}, {"_id": 0}).to_list(1000)
-        total_paid = sum(p.get("net_payout", 0) for p in payouts if p.get("status") == "paid")
-        pending_payout = net_revenue - total_paid
-        
-        seller_revenue.append({
-            "seller_id": seller["id"],
-            "seller_name": seller_user["name"] if seller_user else "Unknown",
-            "business_name": seller.get("business_name", seller_user["name"] if seller_user else "Unknown"),
-            "email": seller_user["email"] if seller_user else "",
-            "total_orders": total_orders,
-            "gross_revenue": round(gross_revenue, 2),
-            "platform_fee": round(platform_fee, 2),
-            "net_revenue": round(net_revenue, 2),
-            "total_paid": round(total_paid, 2),
-            "pending_payout": round(pending_payout, 2),
-            "status": seller.get("status", "pending")
-        })
+    def first(path: str, default: Any = 0) -> Dict[str, Any]:
+        return {"$ifNull": [{"$arrayElemAt": [path, 0]}, default]}
     
-    # Sort by gross revenue descending
-    seller_revenue.sort(key=lambda x: x["gross_revenue"], reverse=True)
+    # One round-trip: every seller joined with its user, fee totals and paid payouts
+    pipeline = [
+        {"$lookup": {"from": "users", "localField": "user_id", "foreignField": "id", "as": "user"}},
+        {"$lookup": {
+            "from": "platform_fees",
+            "let": {"seller_id": "$id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$seller_id", "$$seller_id"]}}},
+                {"$group": {
+                    "_id": None,
+                    "total_orders": {"$sum": 1},
+                    "gross_revenue": {"$sum": "$order_amount"},
+                    "platform_fee": {"$sum": "$fee_amount"},
+                    "net_revenue": {"$sum": "$seller_payout"}
+                }}
+            ],
+            "as": "fees"
+        }},
+        {"$lookup": {
+            "from": "seller_payouts",
+            "let": {"seller_id": "$id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$seller_id", "$$seller_id"]},
+                    {"$eq": ["$status", "paid"]}
+                ]}}},
+                {"$group": {"_id": None, "total_paid": {"$sum": "$net_payout"}}}
+            ],
+            "as": "payouts"
+        }},
+        {"$project": {
+            "_id": 0,
+            "seller_id": "$id",
+            "seller_name": first("$user.name", "Unknown"),
+            "business_name": {"$ifNull": ["$business_name", first("$user.name", "Unknown")]},
+            "email": first("$user.email", ""),
+            "total_orders": first("$fees.total_orders"),
+            "gross_revenue": {"$round": [first("$fees.gross_revenue"), 2]},
+            "platform_fee": {"$round": [first("$fees.platform_fee"), 2]},
+            "net_revenue": {"$round": [first("$fees.net_revenue"), 2]},
+            "total_paid": {"$round": [first("$payouts.total_paid"), 2]},
+            "status": {"$ifNull": ["$status", "pending"]}
+        }},
+        {"$set": {"pending_payout": {"$round": [{"$subtract": ["$net_revenue", "$total_paid"]}, 2]}}},
+        {"$facet": {
+            "sellers": [
+                {"$sort": {sort: direction, "seller_id": 1}},
+                {"$skip": max(skip, 0)},
+                {"$limit": limit}
+            ],
+            "summary": [
+                {"$group": {
+                    "_id": None,
+                    "total_sellers": {"$sum": 1},
+                    "total_gross_revenue": {"$sum": "$gross_revenue"},
+                    "total_platform_fee": {"$sum": "$platform_fee"},
+                    "total_seller_payouts": {"$sum": "$total_paid"},
+                    "total_pending": {"$sum": "$pending_payout"}
+                }},
+                {"$project": {"_id": 0}}
+            ]
+        }}
+    ]
+    
+    (result,) = await db.sellers.aggregate(pipeline).to_list(1)
+    summary = result["summary"][0] if result["summary"] else {
+        "total_sellers": 0,
+        "total_gross_revenue": 0,
+        "total_platform_fee": 0,
+        "total_seller_payouts": 0,
+        "total_pending": 0
+    }
     
     return {
-        "sellers": seller_revenue,
-        "summary": {
-            "total_gross_revenue": sum(s["gross_revenue"] for s in seller_revenue),
-            "total_platform_fee": sum(s["platform_fee"] for s in seller_revenue),
-            "total_seller_payouts": sum(s["total_paid"] for s in seller_revenue),
-            "total_pending": sum(s["pending_payout"] for s in seller_revenue)
-        }
+        "sellers": result["sellers"],
+        "summary": summary,
+        "skip": max(skip, 0),
+        "limit": limit
     }
 
 # ============== CATEGORIES ==============
 @api_router.get("/categories")
 async def get_categories():
-    products = await db.products.find({"is_active": True}, {"_id": 0, "category": 1}).to_list(10000)
-    categories = list(set(p["category"] for p in products))
-    return {"categories": categories}
+    async def load():
+        return {"categories": sorted(await db.products.distinct("category", {"is_active": True}))}
+    
+    return await config_cache.get("categories", load)
 
 # ============== ADMIN USER MANAGEMENT ==============
 @api_router.get("/admin/users")
@@ -1784,6 +2881,21 @@ async def get_all_users(
     users = await db.users.find(query, {"_id": 0, "password_hash": 0}).to_list(10000)
     return users
 
+# ============== RUNTIME METRICS ==============
+@api_router.get("/admin/metrics")
+async def get_runtime_metrics(user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
+    """In-process cache and worker counters for this API worker"""
+    return {
+        "user_cache": user_cache.stats(),
+        "password_hash_pool": password_hash_pool.stats(),
+        "home_rankings": home_rankings.stats(),
+        "product_view_buffer": product_view_buffer.stats(),
+        "suggestion_index": suggestion_index.stats(),
+        "facet_index": facet_index.stats(),
+        "config_cache": config_cache.stats(),
+        "response_compression": response_compressor.stats()
+    }
+
 # ============== COUPON ROUTES ==============
 @api_router.post("/admin/coupons", response_model=Coupon)
 async def create_coupon(
@@ -1862,20 +2974,24 @@ async def create_ticker_message(
     )
     
     await db.ticker_messages.insert_one(ticker.model_dump())
+    config_cache.invalidate("active_ticker")
     return ticker
 
 @api_router.get("/ticker/active")
 async def get_active_ticker():
-    ticker = await db.ticker_messages.find_one(
-        {"is_active": True},
-        {"_id": 0},
-        sort=[("priority", -1), ("created_at", -1)]
-    )
-    
-    if not ticker:
-        return {"message": "🔥 SALE — Only 24 hours left • Grab the best deals • Free shipping on selected items"}
+    async def load():
+        ticker = await db.ticker_messages.find_one(
+            {"is_active": True},
+            {"_id": 0},
+            sort=[("priority", -1), ("created_at", -1)]
+        )
+        
+        if not ticker:
+            return {"message": "🔥 SALE — Only 24 hours left • Grab the best deals • Free shipping on selected items"}
+        
+        return ticker
     
-    return ticker
+    return await config_cache.get("active_ticker", load)
 
 # ============== NOTIFICATION PREFERENCES ==============
 @api_router.get("/notifications/preferences")
@@ -1902,6 +3018,115 @@ async def update_notification_preferences(
     return {"message": "Preferences updated"}
 
 # ============== PRODUCT VIEW TRACKING ==============
+class ProductViewBuffer:
+    """Write-behind buffer that coalesces product views and flushes them in batches"""
+
+    def __init__(self, flush_seconds: float = 2.0, max_events: int = 20000):
+        self.flush_seconds = flush_seconds
+        self.max_events = max_events
+        self._events: List[Dict[str, Any]] = []
+        self._counts: Dict[str, int] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.buffered = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.flushes = 0
+
+    def add(self, view: Dict[str, Any]) -> bool:
+        if len(self._events) >= self.max_events:
+            self.dropped += 1
+            return False
+        self._events.append(view)
+        self._counts[view["product_id"]] = self._counts.get(view["product_id"], 0) + 1
+        self.buffered += 1
+        if len(self._events) >= self.max_events // 2:
+            self._wake.set()
+        return True
+
+    async def flush(self):
+        events, counts = self._events, self._counts
+        self._events, self._counts = [], {}
+        if not events:
+            return
+        daily_counts: Dict[Tuple[str, str], int] = {}
+        for event in events:
+            key = (event["product_id"], event["viewed_at"].strftime("%Y-%m-%d"))
+            daily_counts[key] = daily_counts.get(key, 0) + 1
+        try:
+            await asyncio.gather(
+                db.products.bulk_write([
+                    UpdateOne({"id": product_id}, {"$inc": {"view_count": count}})
+                    for product_id, count in counts.items()
+                ], ordered=False),
+                db.product_view_daily.bulk_write([
+                    UpdateOne({"product_id": product_id, "day": day}, {"$inc": {"count": count}}, upsert=True)
+                    for (product_id, day), count in daily_counts.items()
+                ], ordered=False),
+                db.product_views.insert_many(events, ordered=False)
+            )
+            self.flushed += len(events)
+            self.flushes += 1
+            suggestion_index.add_views(counts)
+        except Exception:
+            self.dropped += len(events)
+            logger.exception(f"Failed to flush {len(events)} product views")
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        # Let the loop finish any in-flight flush rather than cancelling it with its events swapped out
+        self._stopping = True
+        self._wake.set()
+        if self._task:
+            with suppress(asyncio.CancelledError):
+                await self._task
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._events),
+            "max_events": self.max_events,
+            "flush_seconds": self.flush_seconds,
+            "buffered": self.buffered,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "flushes": self.flushes
+        }
+
+async def rebuild_product_view_daily():
+    """Backfill product_view_daily from the raw product_views history"""
+    await db.product_views.aggregate([
+        {"$group": {
+            "_id": {
+                "product_id": "$product_id",
+                "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$viewed_at"}}
+            },
+            "count": {"$sum": 1}
+        }},
+        {"$project": {"_id": 0, "product_id": "$_id.product_id", "day": "$_id.day", "count": 1}},
+        {"$merge": {"into": "product_view_daily", "on": ["product_id", "day"], "whenMatched": "replace"}}
+    ]).to_list(None)
+
+def product_view_window_start(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+
+product_view_buffer = ProductViewBuffer(
+    flush_seconds=float(os.environ.get("PRODUCT_VIEW_FLUSH_SECONDS", "2")),
+    max_events=int(os.environ.get("PRODUCT_VIEW_BUFFER_SIZE", "20000"))
+)
+
 @api_router.post("/products/{product_id}/view")
 async def track_product_view(product_id: str, session_id: Optional[str] = None, user_id: Optional[str] = None):
     view = ProductView(
@@ -1909,28 +3134,29 @@ async def track_product_view(product_id: str, session_id: Optional[str] = None,
         user_id=user_id,
         session_id=session_id
     )
-    await db.product_views.insert_one(view.model_dump())
-    
-    # Update view count on product
-    await db.products.update_one(
-        {"id": product_id},
-        {"$inc": {"view_count": 1}}
-    )
+    # Raw event and view_count increment are written by the buffer's next flush
+    product_view_buffer.add(view.model_dump())
     return {"message": "View tracked"}
 
 # ============== SEARCH API ==============
+def search_next_cursor(products: List[Dict[str, Any]], sort_key: str, skip: int, limit: int) -> Optional[str]:
+    if sort_key == "score":
+        return encode_cursor({"skip": skip + limit}) if len(products) == limit else None
+    return keyset_next_cursor(products, sort_key, limit)
+
 @api_router.get("/search")
 async def search_products(q: str, category: Optional[str] = None, min_price: Optional[float] = None, 
-                          max_price: Optional[float] = None, sort: Optional[str] = None, limit: int = 50):
+                          max_price: Optional[float] = None, sort: Optional[str] = None, limit: int = 50,
+                          brand: Optional[str] = None, size: Optional[str] = None, color: Optional[str] = None,
+                          price_bucket: Optional[str] = None, facets: bool = False,
+                          cursor: Optional[str] = None, fields: Optional[str] = None):
     query = {"is_active": True}
+    projection = product_projection(fields)
     
-    # Text search
+    # Text search - served by the weighted products_text index (tokenized, stemmed, scored)
     if q:
-        query["$or"] = [
-            {"name": {"$regex": q, "$options": "i"}},
-            {"description": {"$regex": q, "$options": "i"}},
-            {"category": {"$regex": q, "$options": "i"}}
-        ]
+        query["$text"] = {"$search": q}
+        projection["score"] = {"$meta": "textScore"}
     
     # Category filter
     if category:
@@ -1945,8 +3171,32 @@ async def search_products(q: str, category: Optional[str] = None, min_price: Opt
         else:
             query["price"] = {"$lte": max_price}
     
+    # Facet filters (comma-separated values, OR within a facet, AND across facets)
+    selected = {
+        "brand": split_csv(brand),
+        "size": split_csv(size),
+        "color": split_csv(color),
+        "price": split_csv(price_bucket)
+    }
+    facet_clauses = []
+    if selected["brand"]:
+        facet_clauses.append({"$or": [
+            {"filters.brand": {"$in": selected["brand"]}},
+            {"filters.Brand": {"$in": selected["brand"]}}
+        ]})
+    if selected["size"]:
+        query["sizes"] = {"$in": selected["size"]}
+    if selected["color"]:
+        query["colors.name"] = {"$in": selected["color"]}
+    if selected["price"]:
+        facet_clauses.append({"$or": [price_bucket_query(label) for label in selected["price"]]})
+    if facet_clauses:
+        query["$and"] = facet_clauses
+    
     # Sort options
-    sort_field = [("created_at", -1)]  # Default: newest first
+    sort_field = [("created_at", -1)]  # Default: newest first, or most relevant when searching
+    if q and not sort:
+        sort_field = [("score", {"$meta": "textScore"})]
     if sort == "price_low":
         sort_field = [("price", 1)]
     elif sort == "price_high":
@@ -1956,33 +3206,52 @@ async def search_products(q: str, category: Optional[str] = None, min_price: Opt
     elif sort == "popular":
         sort_field = [("view_count", -1)]
     
-    products = await db.products.find(query, {"_id": 0}).sort(sort_field).limit(limit).to_list(limit)
-    return products
+    # Pagination: keyset over (sort key, id), or an offset when ranking by relevance
+    limit = page_size(limit)
+    after = decode_cursor(cursor) if cursor else None
+    skip = 0
+    sort_key, direction = sort_field[0]
+    if sort_key == "score":
+        skip = after.get("skip", 0) if after else 0
+    else:
+        sort_field = sort_field + [("id", direction)]
+        if fields:
+            projection[sort_key] = 1
+        if after:
+            query.setdefault("$and", []).append(keyset_filter(sort_key, direction, after))
+    
+    products_query = db.products.find(query, projection).sort(sort_field).skip(skip).limit(limit).to_list(limit)
+    if not facets:
+        products = await products_query
+        fast = FastJSONResponse(products)
+        set_next_cursor_header(fast, search_next_cursor(products, sort_key, skip, limit))
+        return fast
+    
+    # Facet counts come from the in-memory facet index; only text matching needs Mongo
+    candidates = facet_index.candidates(category, min_price, max_price)
+    if q:
+        text_query = db.products.find(
+            {"is_active": True, "$text": {"$search": q}},
+            {"_id": 0, "id": 1}
+        ).limit(FACET_TEXT_CANDIDATES).to_list(FACET_TEXT_CANDIDATES)
+        products, text_matches = await asyncio.gather(products_query, text_query)
+        text_ids = {doc["id"] for doc in text_matches}
+        candidates = text_ids if candidates is None else candidates & text_ids
+    else:
+        products = await products_query
+    
+    next_cursor = search_next_cursor(products, sort_key, skip, limit)
+    fast = FastJSONResponse({"products": products, "facets": facet_index.counts(selected, candidates), "next_cursor": next_cursor})
+    set_next_cursor_header(fast, next_cursor)
+    return fast
 
 @api_router.get("/search/suggestions")
 async def get_search_suggestions(q: str, limit: int = 10):
     if not q or len(q) < 2:
         return {"suggestions": [], "products": []}
     
-    # Get product name suggestions
-    products = await db.products.find(
-        {
-            "is_active": True,
-            "name": {"$regex": q, "$options": "i"}
-        },
-        {"_id": 0, "name": 1, "id": 1, "category": 1, "price": 1, "images": 1}
-    ).limit(limit).to_list(limit)
-    
-    # Get category suggestions
-    categories = await db.products.distinct("category", {
-        "is_active": True,
-        "category": {"$regex": q, "$options": "i"}
-    })
-    
-    return {
-        "suggestions": categories[:5],
-        "products": products
-    }
+    # Served from the in-memory prefix index, ranked by view count
+    return suggestion_index.suggest(q, limit)
 
 # ============== ADDRESS MANAGEMENT ==============
 @api_router.post("/addresses", response_model=Address)
@@ -2207,6 +3476,7 @@ async def update_user_profile(
         {"id": user["id"]},
         {"$set": update_data}
     )
+    invalidate_cached_user(user["id"])
     
     updated_user = await db.users.find_one({"id": user["id"]}, {"_id": 0, "password_hash": 0})
     return updated_user
@@ -2222,27 +3492,23 @@ async def mark_review_helpful(review_id: str):
 
 @api_router.get("/reviews/product/{product_id}/summary")
 async def get_review_summary(product_id: str):
-    reviews = await db.reviews.find({"product_id": product_id}, {"_id": 0}).to_list(10000)
+    stats = await db.review_stats.find_one({"product_id": product_id}, {"_id": 0})
     
-    if not reviews:
+    if not stats or not stats.get("count"):
         return {
             "total_reviews": 0,
             "average_rating": 0,
             "rating_distribution": {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
         }
     
-    total = len(reviews)
-    avg_rating = sum(r["rating"] for r in reviews) / total
-    
-    distribution = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-    for review in reviews:
-        distribution[review["rating"]] += 1
+    histogram = stats.get("histogram", {})
+    distribution = {rating: histogram.get(str(rating), 0) for rating in (5, 4, 3, 2, 1)}
     
     return {
-        "total_reviews": total,
-        "average_rating": round(avg_rating, 1),
+        "total_reviews": stats["count"],
+        "average_rating": round(stats["sum"] / stats["count"], 1),
         "rating_distribution": distribution,
-        "reviews_with_photos": len([r for r in reviews if r.get("images")])
+        "reviews_with_photos": stats.get("with_photos", 0)
     }
 
 # ============== DELIVERY PARTNER APIS ==============
@@ -2261,7 +3527,7 @@ async def register_delivery_partner(
     # Create user account with delivery_partner role
     new_user = User(
         email=partner_data.email,
-        password_hash=hash_password(password),
+        password_hash=await hash_password(password),
         name=partner_data.company_name,
         phone=partner_data.contact_number,
         role=UserRole.DELIVERY_PARTNER
@@ -2537,15 +3803,8 @@ async def get_seller_performance(user: Dict[str, Any] = Depends(require_role([Us
     if not seller:
         raise HTTPException(status_code=404, detail="Seller profile not found")
     
-    # Update performance metrics
-    await update_seller_performance(seller["id"])
-    
-    performance = await db.seller_performance.find_one({"seller_id": seller["id"]}, {"_id": 0})
-    
-    if not performance:
-        performance = SellerPerformance(seller_id=seller["id"]).model_dump()
-    
-    return performance
+    counters = await db.seller_performance.find_one({"seller_id": seller["id"]}, {"_id": 0})
+    return seller_performance_view(seller["id"], counters)
 
 @api_router.get("/admin/seller-performance/{seller_id}")
 async def get_seller_performance_admin(
@@ -2553,13 +3812,22 @@ async def get_seller_performance_admin(
     user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))
 ):
     """Admin views seller performance"""
-    await update_seller_performance(seller_id)
-    performance = await db.seller_performance.find_one({"seller_id": seller_id}, {"_id": 0})
-    
-    if not performance:
-        performance = SellerPerformance(seller_id=seller_id).model_dump()
+    counters = await db.seller_performance.find_one({"seller_id": seller_id}, {"_id": 0})
+    return seller_performance_view(seller_id, counters)
+
+@api_router.post("/admin/seller-performance/rebuild", status_code=202)
+async def rebuild_seller_performance(
+    seller_id: Optional[str] = None,
+    user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))
+):
+    """Admin repairs performance counters from orders and reviews"""
+    if seller_id:
+        await update_seller_performance(seller_id)
+        counters = await db.seller_performance.find_one({"seller_id": seller_id}, {"_id": 0})
+        return seller_performance_view(seller_id, counters)
     
-    return performance
+    run_in_background(update_seller_performance())
+    return {"message": "Seller performance rebuild started"}
 
 # ============== SHIPPING LABEL & TRACKING APIS ==============
 @api_router.post("/shipping-labels", response_model=ShippingLabel)
@@ -2705,15 +3973,22 @@ async def update_delivery_status(
     }
     
     if status_update.status in order_status_map:
-        await db.orders.update_one(
+        new_status = order_status_map[status_update.status]
+        previous = await db.orders.find_one_and_update(
             {"id": order_id},
             {
                 "$set": {
-                    "status": order_status_map[status_update.status],
+                    "status": new_status,
                     "updated_at": datetime.now(timezone.utc)
                 }
-            }
+            },
+            projection={"_id": 0}
         )
+        if previous:
+            await asyncio.gather(
+                record_order_status_change(previous, new_status),
+                record_order_performance_status(previous, new_status)
+            )
         
         # Send notification to customer
         notification = Notification(
@@ -3120,7 +4395,7 @@ async def get_ticket_responses(ticket_id: str, user: Dict[str, Any] = Depends(ge
 
 # ============== SELLER STORE APIS ==============
 @api_router.get("/stores/{seller_id}")
-async def get_seller_store(seller_id: str):
+async def get_seller_store(seller_id: str, fields: Optional[str] = None):
     """Get seller's store details"""
     store = await db.seller_stores.find_one({"seller_id": seller_id}, {"_id": 0})
     if not store:
@@ -3134,7 +4409,7 @@ async def get_seller_store(seller_id: str):
     # Get store products
     products = await db.products.find(
         {"seller_id": seller_id, "is_active": True},
-        {"_id": 0}
+        product_projection(fields)
     ).to_list(100)
     
     return {"store": store, "products": products}
@@ -3165,11 +4440,14 @@ async def update_my_store(
 @api_router.get("/footer-content")
 async def get_footer_content():
     """Get footer content"""
-    content = await db.footer_content.find_one({"id": "footer_content"}, {"_id": 0})
-    if not content:
-        content = FooterContent().model_dump()
-        await db.footer_content.insert_one(content)
-    return content
+    async def load():
+        content = await db.footer_content.find_one({"id": "footer_content"}, {"_id": 0})
+        if not content:
+            content = FooterContent().model_dump()
+            await db.footer_content.insert_one(dict(content))
+        return content
+    
+    return await config_cache.get("footer_content", load)
 
 @api_router.put("/admin/footer-content")
 async def update_footer_content(
@@ -3186,6 +4464,7 @@ async def update_footer_content(
         upsert=True
     )
     
+    config_cache.invalidate("footer_content")
     content = await db.footer_content.find_one({"id": "footer_content"}, {"_id": 0})
     return content
 
@@ -3193,11 +4472,13 @@ async def update_footer_content(
 @api_router.get("/offer-cards")
 async def get_offer_cards():
     """Get active offer cards"""
-    offers = await db.offer_cards.find(
-        {"is_active": True},
-        {"_id": 0}
-    ).sort("display_order", 1).to_list(10)
-    return offers
+    async def load():
+        return await db.offer_cards.find(
+            {"is_active": True},
+            {"_id": 0}
+        ).sort("display_order", 1).to_list(10)
+    
+    return await config_cache.get("offer_cards", load)
 
 @api_router.post("/admin/offer-cards")
 async def create_offer_card(
@@ -3207,6 +4488,7 @@ async def create_offer_card(
     """Admin creates offer card"""
     offer = OfferCard(**offer_data.model_dump())
     await db.offer_cards.insert_one(offer.model_dump())
+    config_cache.invalidate("offer_cards")
     return offer
 
 @api_router.delete("/admin/offer-cards/{offer_id}")
@@ -3216,18 +4498,29 @@ async def delete_offer_card(
 ):
     """Admin deletes offer card"""
     await db.offer_cards.delete_one({"id": offer_id})
+    config_cache.invalidate("offer_cards")
     return {"message": "Offer card deleted"}
 
 # ============== BANK OFFERS APIS ==============
 @api_router.get("/bank-offers")
 async def get_bank_offers():
     """Get active bank offers"""
-    now = datetime.now(timezone.utc)
-    offers = await db.bank_offers.find(
-        {"is_active": True, "valid_until": {"$gte": now}},
-        {"_id": 0}
-    ).to_list(100)
-    return offers
+    async def load():
+        return await db.bank_offers.find(
+            {"is_active": True, "valid_until": {"$gte": datetime.now(timezone.utc)}},
+            {"_id": 0}
+        ).to_list(100)
+    
+    def still_valid(offer: Dict[str, Any]) -> bool:
+        valid_until = offer.get("valid_until")
+        if not isinstance(valid_until, datetime):
+            return True
+        if valid_until.tzinfo is None:
+            valid_until = valid_until.replace(tzinfo=timezone.utc)
+        return valid_until >= datetime.now(timezone.utc)
+    
+    # The cached list can outlive an offer's validity, so expiry is re-checked per request
+    return [offer for offer in await config_cache.get("bank_offers", load) if still_valid(offer)]
 
 @api_router.post("/admin/bank-offers")
 async def create_bank_offer(
@@ -3237,6 +4530,7 @@ async def create_bank_offer(
     """Admin creates bank offer"""
     offer = BankOffer(**offer_data.model_dump())
     await db.bank_offers.insert_one(offer.model_dump())
+    config_cache.invalidate("bank_offers")
     return offer
 
 @api_router.delete("/admin/bank-offers/{offer_id}")
@@ -3246,6 +4540,7 @@ async def delete_bank_offer(
 ):
     """Admin deletes bank offer"""
     await db.bank_offers.delete_one({"id": offer_id})
+    config_cache.invalidate("bank_offers")
     return {"message": "Bank offer deleted"}
 
 # ============== PROFILE PICTURE UPLOAD API ==============
@@ -3259,6 +4554,7 @@ async def update_profile_picture(
         {"id": user["id"]},
         {"$set": {"profile_picture": profile_picture}}
     )
+    invalidate_cached_user(user["id"])
     return {"message": "Profile picture updated", "profile_picture": profile_picture}
 
 @api_router.put("/profile/bio")
@@ -3271,24 +4567,28 @@ async def update_profile_bio(
         {"id": user["id"]},
         {"$set": {"bio": bio}}
     )
+    invalidate_cached_user(user["id"])
     return {"message": "Bio updated", "bio": bio}
 
 # ============== PLATFORM SETTINGS APIS ==============
 @api_router.get("/platform-settings")
 async def get_platform_settings():
     """Get platform settings"""
-    settings = await db.platform_settings.find_one({"id": "platform_settings"}, {"_id": 0})
-    if not settings:
-        settings = PlatformSettings().model_dump()
-        await db.platform_settings.insert_one(settings)
+    async def load():
         settings = await db.platform_settings.find_one({"id": "platform_settings"}, {"_id": 0})
+        if not settings:
+            settings = PlatformSettings().model_dump()
+            await db.platform_settings.insert_one(settings)
+            settings = await db.platform_settings.find_one({"id": "platform_settings"}, {"_id": 0})
+        
+        # Convert datetime to ISO string for JSON serialization
+        if settings and "updated_at" in settings:
+            if hasattr(settings["updated_at"], "isoformat"):
+                settings["updated_at"] = settings["updated_at"].isoformat()
+        
+        return settings
     
-    # Convert datetime to ISO string for JSON serialization
-    if settings and "updated_at" in settings:
-        if hasattr(settings["updated_at"], "isoformat"):
-            settings["updated_at"] = settings["updated_at"].isoformat()
-    
-    return settings
+    return await config_cache.get("platform_settings", load)
 
 @api_router.put("/admin/platform-settings")
 async def update_platform_settings(
@@ -3305,6 +4605,7 @@ async def update_platform_settings(
         upsert=True
     )
     
+    config_cache.invalidate("platform_settings")
     settings = await db.platform_settings.find_one({"id": "platform_settings"}, {"_id": 0})
     
     # Convert datetime to ISO string for JSON serialization
@@ -3328,57 +4629,199 @@ async def get_seller_payouts(
     payouts = await db.seller_payouts.find(query, {"_id": 0}).sort("created_at", -1).to_list(1000)
     return payouts
 
-@api_router.post("/admin/generate-payouts")
+PAYOUT_BATCH_SIZE = int(os.environ.get("PAYOUT_BATCH_SIZE", "1000"))
+PAYOUT_JOB_STALE_SECONDS = int(os.environ.get("PAYOUT_JOB_STALE_SECONDS", "600"))
+PAYOUT_JOB_HEARTBEAT_SECONDS = int(os.environ.get("PAYOUT_JOB_HEARTBEAT_SECONDS", "30"))
+
+def payout_period(cycle_days: int) -> Tuple[datetime, datetime]:
+    """Payout periods end at UTC midnight so reruns on the same day cover the same window"""
+    end_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return end_date - timedelta(days=cycle_days), end_date
+
+async def expire_stale_payout_jobs(query: Optional[Dict[str, Any]] = None):
+    """Fail queued/running jobs that stopped reporting progress (server restart, crashed worker)"""
+    now = datetime.now(timezone.utc)
+    await db.payout_jobs.update_many(
+        {
+            **(query or {}),
+            "status": {"$in": ["queued", "running"]},
+            "updated_at": {"$lt": now - timedelta(seconds=PAYOUT_JOB_STALE_SECONDS)}
+        },
+        {"$set": {"status": "failed", "error": "Payout job stopped responding", "finished_at": now}}
+    )
+
+async def payout_job_heartbeat(job_id: str):
+    """Keep updated_at fresh while the job runs; the aggregation yields no rows until its $group stages finish"""
+    while True:
+        await asyncio.sleep(PAYOUT_JOB_HEARTBEAT_SECONDS)
+        await db.payout_jobs.update_one(
+            {"id": job_id, "status": "running"},
+            {"$set": {"updated_at": datetime.now(timezone.utc)}}
+        )
+
+async def run_payout_job(job_id: str, settings: Dict[str, Any], start_date: datetime, end_date: datetime):
+    """Compute every seller's gross for the period in one pass and write payouts in batches"""
+    started = await db.payout_jobs.update_one(
+        {"id": job_id, "status": "queued"},
+        {"$set": {"status": "running", "updated_at": datetime.now(timezone.utc)}}
+    )
+    if not started.modified_count:
+        logger.warning(f"Payout job {job_id} expired before it started")
+        return
+    
+    pipeline = [
+        {"$match": {"status": "delivered", "created_at": {"$gte": start_date, "$lte": end_date}}},
+        {"$unwind": "$items"},
+        {"$match": {"items.seller_id": {"$ne": None}}},
+        {"$group": {
+            "_id": {"seller_id": "$items.seller_id", "order_id": "$id"},
+            "amount": {"$sum": {"$multiply": ["$items.price", "$items.quantity"]}}
+        }},
+        {"$group": {
+            "_id": "$_id.seller_id",
+            "total_orders": {"$sum": 1},
+            "gross_amount": {"$sum": "$amount"}
+        }},
+        # Only sellers that still exist get a payout
+        {"$lookup": {"from": "sellers", "localField": "_id", "foreignField": "id", "as": "seller"}},
+        {"$match": {"seller.0": {"$exists": True}}},
+        {"$project": {"seller": 0}}
+    ]
+    
+    processed = created = skipped = 0
+    
+    async def write_batch(batch: List[Dict[str, Any]]):
+        nonlocal created, skipped
+        try:
+            result = await db.seller_payouts.insert_many(batch, ordered=False)
+            created += len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Duplicate (seller, period) payouts from an earlier run are skipped, anything else is fatal
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != 11000 for error in errors):
+                raise
+            created += e.details.get("nInserted", 0)
+            skipped += len(errors)
+    
+    heartbeat = asyncio.create_task(payout_job_heartbeat(job_id))
+    try:
+        batch: List[Dict[str, Any]] = []
+        async for row in db.orders.aggregate(pipeline, allowDiskUse=True):
+            gross_amount = round(row["gross_amount"], 2)
+            platform_fee = round((gross_amount * settings["platform_fee_percentage"]) / 100, 2)
+            promotion_fee = round((gross_amount * settings["promotion_fee_percentage"]) / 100, 2)
+            batch.append(SellerPayout(
+                seller_id=row["_id"],
+                period_start=start_date,
+                period_end=end_date,
+                total_orders=row["total_orders"],
+                gross_amount=gross_amount,
+                platform_fee=platform_fee,
+                promotion_fee=promotion_fee,
+                net_payout=round(gross_amount - platform_fee - promotion_fee, 2)
+            ).model_dump())
+            processed += 1
+            
+            if len(batch) >= PAYOUT_BATCH_SIZE:
+                await write_batch(batch)
+                batch = []
+                await db.payout_jobs.update_one(
+                    {"id": job_id, "status": "running"},
+                    {"$set": {
+                        "sellers_processed": processed,
+                        "payouts_created": created,
+                        "payouts_skipped": skipped,
+                        "updated_at": datetime.now(timezone.utc)
+                    }}
+                )
+        
+        if batch:
+            await write_batch(batch)
+        
+        status, error = "completed", None
+    except asyncio.CancelledError:
+        status, error = "failed", "Interrupted by server shutdown"
+        raise
+    except Exception as e:
+        logger.exception(f"Payout job {job_id} failed")
+        status, error = "failed", str(e)
+    finally:
+        heartbeat.cancel()
+        with suppress(asyncio.CancelledError):
+            await heartbeat
+        now = datetime.now(timezone.utc)
+        # A job already expired as stale stays failed rather than being revived
+        finished = await db.payout_jobs.update_one(
+            {"id": job_id, "status": "running"},
+            {"$set": {
+                "status": status,
+                "error": error,
+                "sellers_processed": processed,
+                "payouts_created": created,
+                "payouts_skipped": skipped,
+                "updated_at": now,
+                "finished_at": now
+            }}
+        )
+        if finished.modified_count:
+            logger.info(f"Payout job {job_id} {status}: {created} created, {skipped} already existed")
+        else:
+            logger.warning(f"Payout job {job_id} finished ({status}) after being marked stale")
+
+@api_router.post("/admin/generate-payouts", status_code=202)
 async def generate_payouts(user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
-    """Generate weekly payouts for all sellers"""
-    settings = await db.platform_settings.find_one({"id": "platform_settings"})
+    """Start a background job generating payouts for all sellers for the last payment cycle"""
+    settings = await db.platform_settings.find_one({"id": "platform_settings"}, {"_id": 0})
     if not settings:
         settings = PlatformSettings().model_dump()
     
-    # Get date range (last week)
-    end_date = datetime.now(timezone.utc)
-    start_date = end_date - timedelta(days=settings["payment_cycle_days"])
+    start_date, end_date = payout_period(settings["payment_cycle_days"])
     
-    # Get all sellers
-    sellers = await db.sellers.find({}, {"_id": 0}).to_list(1000)
+    # Re-clicking while a run for this period is still alive returns that run
+    running = await db.payout_jobs.find_one({
+        "period_start": start_date,
+        "period_end": end_date,
+        "status": {"$in": ["queued", "running"]},
+        "updated_at": {"$gte": datetime.now(timezone.utc) - timedelta(seconds=PAYOUT_JOB_STALE_SECONDS)}
+    }, {"_id": 0})
+    if running:
+        return {"message": "Payout generation is already running", "job": running}
     
-    payouts_created = []
-    for seller in sellers:
-        # Get orders for this seller in the period
-        orders = await db.orders.find({
-            "items.seller_id": seller["id"],
-            "status": "delivered",
-            "created_at": {"$gte": start_date, "$lte": end_date}
-        }).to_list(1000)
-        
-        if not orders:
-            continue
-        
-        # Calculate amounts
-        gross_amount = 0
-        for order in orders:
-            seller_items = [item for item in order["items"] if item.get("seller_id") == seller["id"]]
-            gross_amount += sum([item["price"] * item["quantity"] for item in seller_items])
-        
-        platform_fee = round((gross_amount * settings["platform_fee_percentage"]) / 100, 2)
-        promotion_fee = round((gross_amount * settings["promotion_fee_percentage"]) / 100, 2)
-        net_payout = round(gross_amount - platform_fee - promotion_fee, 2)
-        
-        payout = SellerPayout(
-            seller_id=seller["id"],
-            period_start=start_date,
-            period_end=end_date,
-            total_orders=len(orders),
-            gross_amount=gross_amount,
-            platform_fee=platform_fee,
-            promotion_fee=promotion_fee,
-            net_payout=net_payout
-        )
-        
-        await db.seller_payouts.insert_one(payout.model_dump())
-        payouts_created.append(payout.model_dump())
+    now = datetime.now(timezone.utc)
+    job = {
+        "id": str(uuid.uuid4()),
+        "status": "queued",
+        "period_start": start_date,
+        "period_end": end_date,
+        "sellers_processed": 0,
+        "payouts_created": 0,
+        "payouts_skipped": 0,
+        "error": None,
+        "started_by": user["id"],
+        "created_at": now,
+        "updated_at": now,
+        "finished_at": None
+    }
+    await db.payout_jobs.insert_one(job.copy())
     
-    return {"message": f"Generated {len(payouts_created)} payouts", "payouts": payouts_created}
+    run_in_background(run_payout_job(job["id"], settings, start_date, end_date))
+    
+    return {"message": "Payout generation started", "job": job}
+
+@api_router.get("/admin/payout-jobs")
+async def get_payout_jobs(user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
+    """Admin views recent payout generation runs"""
+    await expire_stale_payout_jobs()
+    return await db.payout_jobs.find({}, {"_id": 0}).sort("created_at", -1).to_list(20)
+
+@api_router.get("/admin/payout-jobs/{job_id}")
+async def get_payout_job(job_id: str, user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
+    """Admin polls the progress of a payout generation run"""
+    await expire_stale_payout_jobs({"id": job_id})
+    job = await db.payout_jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Payout job not found")
+    return job
 
 @api_router.put("/admin/seller-payouts/{payout_id}/process")
 async def process_payout(
@@ -3501,11 +4944,14 @@ async def get_categories_list():
 @api_router.get("/storefront-visibility")
 async def get_storefront_visibility():
     """Get storefront visibility settings"""
-    visibility = await db.storefront_visibility.find_one({"id": "storefront_visibility"}, {"_id": 0})
-    if not visibility:
-        visibility = StorefrontVisibility().model_dump()
-        await db.storefront_visibility.insert_one(visibility)
-    return visibility
+    async def load():
+        visibility = await db.storefront_visibility.find_one({"id": "storefront_visibility"}, {"_id": 0})
+        if not visibility:
+            visibility = StorefrontVisibility().model_dump()
+            await db.storefront_visibility.insert_one(dict(visibility))
+        return visibility
+    
+    return await config_cache.get("storefront_visibility", load)
 
 @api_router.put("/admin/storefront-visibility")
 async def update_storefront_visibility(
@@ -3522,6 +4968,7 @@ async def update_storefront_visibility(
         upsert=True
     )
     
+    config_cache.invalidate("storefront_visibility")
     visibility = await db.storefront_visibility.find_one({"id": "storefront_visibility"}, {"_id": 0})
     return visibility
 
@@ -3529,11 +4976,13 @@ async def update_storefront_visibility(
 @api_router.get("/hero-banners")
 async def get_hero_banners():
     """Get all active hero banners"""
-    banners = await db.hero_banners.find(
-        {"is_active": True}, 
-        {"_id": 0}
-    ).sort("display_order", 1).to_list(20)
-    return banners
+    async def load():
+        return await db.hero_banners.find(
+            {"is_active": True}, 
+            {"_id": 0}
+        ).sort("display_order", 1).to_list(20)
+    
+    return await config_cache.get("hero_banners", load)
 
 @api_router.get("/admin/hero-banners")
 async def get_all_hero_banners(user: Dict[str, Any] = Depends(require_role([UserRole.ADMIN]))):
@@ -3549,6 +4998,7 @@ async def create_hero_banner(
     """Admin creates a new hero banner"""
     banner = HeroBanner(**banner_data.model_dump())
     await db.hero_banners.insert_one(banner.model_dump())
+    config_cache.invalidate("hero_banners")
     return banner
 
 @api_router.put("/admin/hero-banners/{banner_id}")
@@ -3560,6 +5010,7 @@ async def update_hero_banner(
     """Admin updates a hero banner"""
     update_data = {k: v for k, v in updates.model_dump().items() if v is not None}
     await db.hero_banners.update_one({"id": banner_id}, {"$set": update_data})
+    config_cache.invalidate("hero_banners")
     banner = await db.hero_banners.find_one({"id": banner_id}, {"_id": 0})
     return banner
 
@@ -3570,17 +5021,21 @@ async def delete_hero_banner(
 ):
     """Admin deletes a hero banner"""
     await db.hero_banners.delete_one({"id": banner_id})
+    config_cache.invalidate("hero_banners")
     return {"message": "Banner deleted"}
 
 # ============== SUPPORT SETTINGS APIS ==============
 @api_router.get("/support-settings")
 async def get_support_settings():
     """Get support settings"""
-    settings = await db.support_settings.find_one({"id": "support_settings"}, {"_id": 0})
-    if not settings:
-        settings = SupportSettings().model_dump()
-        await db.support_settings.insert_one(settings)
-    return settings
+    async def load():
+        settings = await db.support_settings.find_one({"id": "support_settings"}, {"_id": 0})
+        if not settings:
+            settings = SupportSettings().model_dump()
+            await db.support_settings.insert_one(dict(settings))
+        return settings
+    
+    return await config_cache.get("support_settings", load)
 
 @api_router.put("/admin/support-settings")
 async def update_support_settings(
@@ -3597,40 +5052,17 @@ async def update_support_settings(
         upsert=True
     )
     
+    config_cache.invalidate("support_settings")
     settings = await db.support_settings.find_one({"id": "support_settings"}, {"_id": 0})
     return settings
 
 # ============== BESTSELLERS API (Auto-updated based on orders) ==============
 @api_router.get("/products/bestsellers")
-async def get_bestseller_products(limit: int = 10):
+async def get_bestseller_products(response: Response, limit: int = 10):
     """Get bestseller products based on order count"""
-    # Aggregate orders to find most ordered products
-    pipeline = [
-        {"$unwind": "$items"},
-        {"$group": {"_id": "$items.product_id", "order_count": {"$sum": "$items.quantity"}}},
-        {"$sort": {"order_count": -1}},
-        {"$limit": limit}
-    ]
-    
-    bestseller_ids = []
-    async for doc in db.orders.aggregate(pipeline):
-        bestseller_ids.append(doc["_id"])
-    
-    products = []
-    for product_id in bestseller_ids:
-        product = await db.products.find_one({"id": product_id, "is_active": True}, {"_id": 0})
-        if product:
-            products.append(product)
-    
-    # If not enough products from orders, fill with random active products
-    if len(products) < limit:
-        additional = await db.products.find(
-            {"is_active": True, "id": {"$nin": [p["id"] for p in products]}},
-            {"_id": 0}
-        ).sort("created_at", -1).limit(limit - len(products)).to_list(limit - len(products))
-        products.extend(additional)
-    
-    return products
+    # Most ordered products, from the periodically refreshed snapshot
+    set_rankings_age_header(response)
+    return await get_ranked_products("bestsellers", limit)
 
 # ============== TICKER MESSAGE MANAGEMENT ==============
 @api_router.get("/admin/ticker-messages")
@@ -3651,6 +5083,7 @@ async def update_ticker_message(
         {"id": ticker_id},
         {"$set": {"message": message, "is_active": is_active}}
     )
+    config_cache.invalidate("active_ticker")
     return {"message": "Ticker updated"}
 
 @api_router.delete("/admin/ticker/{ticker_id}")
@@ -3660,18 +5093,414 @@ async def delete_ticker_message(
 ):
     """Admin deletes a ticker message"""
     await db.ticker_messages.delete_one({"id": ticker_id})
+    config_cache.invalidate("active_ticker")
     return {"message": "Ticker deleted"}
 
+# ============== HOME PAGE BUNDLE ==============
+HOME_BUNDLE_MAX_LIMIT = 24
+HOME_CONFIG_KEYS = (
+    "hero_banners", "offer_cards", "bank_offers", "active_ticker", "storefront_visibility", "categories"
+)
+
+def json_etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison and may list several tags or be *"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+@api_router.get("/home")
+async def get_home(request: Request, limit: int = 8):
+    """Everything the storefront home page renders above the product grid, in one cached payload"""
+    limit = min(max(limit, 1), HOME_BUNDLE_MAX_LIMIT)
+    
+    async def load():
+        (hero_banners, offer_cards, bank_offers, ticker, visibility, categories,
+         trending, bestsellers, most_viewed) = await asyncio.gather(
+            get_hero_banners(),
+            get_offer_cards(),
+            get_bank_offers(),
+            get_active_ticker(),
+            get_storefront_visibility(),
+            get_categories(),
+            get_ranked_products("trending", limit),
+            get_ranked_products("bestsellers", limit),
+            get_ranked_products("most_viewed", limit)
+        )
+        payload = {
+            "hero_banners": hero_banners,
+            "offer_cards": offer_cards,
+            "bank_offers": bank_offers,
+            "ticker": ticker,
+            "storefront_visibility": visibility,
+            "categories": categories["categories"],
+            "trending": trending,
+            "bestsellers": bestsellers,
+            "most_viewed": most_viewed,
+            "generated_at": datetime.now(timezone.utc)
+        }
+        # Serialized once per snapshot; requests only compare ETags and copy bytes
+        body = FastJSONResponse(payload).body
+        return json_etag(body), body
+    
+    etag, body = await config_cache.get(f"home:{limit}", load, depends_on=HOME_CONFIG_KEYS)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+# ============== INDEX REGISTRY ==============
+# Every index the queries above rely on: (collection, keys, create_index options)
+INDEXES: List[Tuple[str, List[Tuple[str, Any]], Dict[str, Any]]] = [
+    ("users", [("email", 1)], {"unique": True}),
+    ("users", [("id", 1)], {"unique": True}),
+    ("users", [("phone", 1)], {}),
+    ("users", [("role", 1)], {}),
+    ("sellers", [("id", 1)], {"unique": True}),
+    ("sellers", [("user_id", 1)], {}),
+    ("sellers", [("status", 1)], {}),
+    ("products", [("id", 1)], {"unique": True}),
+    ("products", [("seller_id", 1)], {}),
+    ("products", [("seller_id", 1), ("is_active", 1), ("created_at", -1)], {}),
+    ("products", [("is_active", 1), ("created_at", -1), ("id", -1)], {}),
+    ("products", [("is_active", 1), ("category", 1), ("created_at", -1), ("id", -1)], {}),
+    ("products", [("is_active", 1), ("price", 1), ("id", 1)], {}),
+    ("products", [("is_active", 1), ("view_count", -1), ("id", -1)], {}),
+    ("products", [("name", "text"), ("category", "text"), ("description", "text")], {
+        "name": "products_text",
+        "weights": {"name": 10, "category": 5, "description": 1},
+        "default_language": "english"
+    }),
+    ("inventory", [("product_id", 1)], {}),
+    ("inventory", [("seller_id", 1)], {}),
+    ("orders", [("id", 1)], {"unique": True}),
+    ("orders", [("customer_id", 1)], {}),
+    ("orders", [("items.seller_id", 1), ("created_at", -1)], {}),
+    ("orders", [("delivery_partner_id", 1), ("created_at", -1)], {}),
+    ("orders", [("status", 1), ("created_at", 1)], {}),
+    ("reviews", [("product_id", 1)], {}),
+    ("reviews", [("customer_id", 1)], {}),
+    ("review_stats", [("product_id", 1)], {"unique": True}),
+    ("product_views", [("product_id", 1)], {}),
+    ("product_view_daily", [("product_id", 1), ("day", 1)], {"unique": True}),
+    ("product_view_daily", [("day", 1)], {}),
+    ("product_rankings", [("id", 1)], {"unique": True}),
+    ("revenue_rollups", [("day", 1), ("seller_id", 1)], {"unique": True}),
+    ("revenue_rollups", [("seller_id", 1), ("day", 1)], {}),
+    ("platform_fees", [("seller_id", 1), ("created_at", -1)], {}),
+    ("platform_fees", [("order_id", 1)], {}),
+    ("platform_fees", [("created_at", -1)], {}),
+    ("seller_payouts", [("seller_id", 1), ("period_start", 1), ("period_end", 1)], {"unique": True}),
+    ("seller_payouts", [("seller_id", 1), ("created_at", -1)], {}),
+    ("seller_payouts", [("seller_id", 1), ("status", 1)], {}),
+    ("seller_payouts", [("status", 1), ("created_at", -1)], {}),
+    ("payout_jobs", [("id", 1)], {"unique": True}),
+    ("payout_jobs", [("period_start", 1), ("period_end", 1), ("status", 1)], {}),
+    ("payout_jobs", [("created_at", -1)], {}),
+    ("notifications", [("user_id", 1), ("created_at", -1)], {}),
+    ("notifications", [("id", 1)], {}),
+    ("delivery_status", [("order_id", 1), ("timestamp", -1)], {}),
+    ("shipping_labels", [("order_id", 1)], {}),
+    ("delivery_partners", [("id", 1)], {"unique": True}),
+    ("delivery_partners", [("user_id", 1)], {}),
+    ("addresses", [("user_id", 1)], {}),
+    ("warehouses", [("seller_id", 1)], {}),
+    ("return_requests", [("customer_id", 1), ("created_at", -1)], {}),
+    ("return_requests", [("seller_id", 1), ("created_at", -1)], {}),
+    ("tickets", [("customer_id", 1), ("created_at", -1)], {}),
+    ("ticket_responses", [("ticket_id", 1), ("created_at", 1)], {}),
+    ("support_tickets", [("user_id", 1), ("created_at", -1)], {}),
+    ("seller_stores", [("seller_id", 1)], {}),
+    ("seller_performance", [("seller_id", 1)], {}),
+    ("return_policies", [("seller_id", 1)], {}),
+    ("shipping_settings", [("seller_id", 1)], {}),
+    ("business_verification", [("seller_id", 1)], {}),
+    ("user_settings", [("user_id", 1)], {}),
+    ("notification_preferences", [("user_id", 1)], {}),
+    ("coupons", [("code", 1)], {}),
+    ("hero_banners", [("is_active", 1), ("display_order", 1)], {}),
+    ("offer_cards", [("is_active", 1), ("display_order", 1)], {}),
+    ("ticker_messages", [("is_active", 1), ("priority", -1), ("created_at", -1)], {}),
+]
+if os.environ.get("PRODUCT_VIEW_RETENTION_DAYS"):
+    INDEXES.append(("product_views", [("viewed_at", 1)], {
+        "expireAfterSeconds": int(os.environ["PRODUCT_VIEW_RETENTION_DAYS"]) * 86400
+    }))
+
+def index_name(keys: List[Tuple[str, Any]], options: Dict[str, Any]) -> str:
+    """Explicit name, or the name MongoDB generates for these keys"""
+    return options.get("name") or "_".join(f"{field}_{direction}" for field, direction in keys)
+
+async def reconcile_indexes(apply: bool = True, drop_extra: bool = False) -> Dict[str, Dict[str, List[str]]]:
+    """Compare live indexes with INDEXES, create missing ones and optionally drop unregistered ones"""
+    registry: Dict[str, Dict[str, Tuple[List[Tuple[str, Any]], Dict[str, Any]]]] = {}
+    for collection_name, keys, options in INDEXES:
+        registry.setdefault(collection_name, {})[index_name(keys, options)] = (keys, options)
+    
+    report = {}
+    for collection_name, expected in registry.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        missing = [name for name in expected if name not in existing]
+        extra = [name for name in existing if name != "_id_" and name not in expected]
+        changed = [
+            name for name, (keys, options) in expected.items()
+            if name in existing and any(
+                existing[name].get(option) != options.get(option)
+                for option in ("unique", "expireAfterSeconds")
+            )
+        ]
+        created, dropped, failed = [], [], []
+        if apply:
+            for name in missing:
+                keys, options = expected[name]
+                try:
+                    await collection.create_index(keys, **{"name": name, **options})
+                    created.append(name)
+                except PyMongoError as e:
+                    logger.error(f"Failed to create index {collection_name}.{name}: {e}")
+                    failed.append(name)
+            if drop_extra:
+                for name in extra:
+                    await collection.drop_index(name)
+                    dropped.append(name)
+        if missing or extra or changed:
+            report[collection_name] = {
+                "missing": missing,
+                "created": created,
+                "failed": failed,
+                "extra": extra,
+                "dropped": dropped,
+                "changed": changed
+            }
+    return report
+
+# ============== CONDITIONAL GET ==============
+# Read endpoints whose payloads change rarely relative to how often they are fetched
+CONDITIONAL_GET_PATHS = [
+    r"/api/products/[^/]+",
+    r"/api/stores/[^/]+",
+    r"/api/reviews/product/[^/]+/summary",
+    r"/api/categories(/list)?",
+    r"/api/footer-content",
+    r"/api/offer-cards",
+    r"/api/bank-offers",
+    r"/api/hero-banners",
+    r"/api/storefront-visibility",
+    r"/api/support-settings",
+    r"/api/platform-settings",
+    r"/api/ticker/active",
+]
+
+class ConditionalGetMiddleware:
+    """Adds a strong ETag to successful GETs on matching paths and answers If-None-Match with 304"""
+
+    def __init__(self, app, paths: List[str]):
+        self.app = app
+        self.patterns = [re.compile(path) for path in paths]
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not any(pattern.fullmatch(scope["path"]) for pattern in self.patterns)
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+        
+        async def buffered_send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=start["headers"])
+            # Endpoints such as /api/home compute their own ETag
+            if start["status"] == 200 and "etag" not in headers:
+                headers["ETag"] = json_etag(body)
+            if start["status"] == 200 and etag_matches(if_none_match, headers["etag"]):
+                for name in ("content-length", "content-type"):
+                    if name in headers:
+                        del headers[name]
+                start["status"] = 304
+                body = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+        
+        await self.app(scope, receive, buffered_send)
+
+# ============== RESPONSE COMPRESSION ==============
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding as {coding: q}; refused codings stay in with q=0 so a "*" cannot re-enable them"""
+    encodings = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if coding:
+            encodings[coding.lower()] = q
+    return encodings
+
+class ResponseCompressor:
+    """Encoding negotiation, eligibility rules and running cost/savings counters for response compression"""
+
+    def __init__(
+        self,
+        minimum_size: int = 1024,
+        content_types: Optional[List[str]] = None,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        thread_min_size: int = 262144
+    ):
+        self.minimum_size = minimum_size
+        self.content_types = {content_type.strip() for content_type in content_types or [] if content_type.strip()}
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.thread_min_size = thread_min_size
+        self.encodings = (["br"] if brotli else []) + ["gzip"]
+        self.compressed = 0
+        self.skipped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+
+    def choose(self, accept_encoding: Optional[str]) -> Optional[str]:
+        encodings = accepted_encodings(accept_encoding)
+        # An explicit q for a coding overrides "*", so "br;q=0, *" still refuses brotli
+        weights = {coding: encodings.get(coding, encodings.get("*", 0)) for coding in self.encodings}
+        # Highest q wins; on ties brotli is preferred for its smaller output
+        ranked = sorted((coding for coding in self.encodings if weights[coding] > 0), key=lambda coding: -weights[coding])
+        return ranked[0] if ranked else None
+
+    def eligible(self, headers: MutableHeaders, body: bytes) -> bool:
+        content_type = headers.get("content-type", "").split(";")[0].strip()
+        return (
+            len(body) >= self.minimum_size
+            and content_type in self.content_types
+            and "content-encoding" not in headers
+        )
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def compress(self, body: bytes, encoding: str) -> bytes:
+        started = time.perf_counter()
+        if len(body) >= self.thread_min_size:
+            # zlib and brotli release the GIL, so large bodies don't stall the event loop
+            compressed = await asyncio.to_thread(self._compress, body, encoding)
+        else:
+            compressed = self._compress(body, encoding)
+        self.seconds += time.perf_counter() - started
+        self.compressed += 1
+        self.bytes_in += len(body)
+        self.bytes_out += len(compressed)
+        return compressed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "encodings": self.encodings,
+            "minimum_size": self.minimum_size,
+            "compressed": self.compressed,
+            "skipped": self.skipped,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else 0.0,
+            "cpu_ms": round(self.seconds * 1000, 2)
+        }
+
+response_compressor = ResponseCompressor(
+    minimum_size=int(os.environ.get("COMPRESSION_MIN_SIZE", "1024")),
+    content_types=os.environ.get(
+        "COMPRESSION_CONTENT_TYPES", "application/json,text/plain,text/html,text/css,application/javascript"
+    ).split(","),
+    gzip_level=int(os.environ.get("COMPRESSION_GZIP_LEVEL", "6")),
+    brotli_quality=int(os.environ.get("COMPRESSION_BROTLI_QUALITY", "4"))
+)
+
+class CompressionMiddleware:
+    """Compresses complete responses the compressor deems eligible; streaming responses pass through"""
+
+    def __init__(self, app, compressor: ResponseCompressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = self.compressor.choose(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start: Dict[str, Any] = {}
+        passthrough = False
+        
+        async def compressing_send(message):
+            nonlocal passthrough
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if message.get("more_body", False) or not self.compressor.eligible(headers, body):
+                passthrough = True
+                self.compressor.skipped += 1
+                await send(start)
+                await send(message)
+                return
+            
+            compressed = await self.compressor.compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            # The encoded bytes differ from what a strong ETag was computed over
+            if "etag" in headers and not headers["etag"].startswith("W/"):
+                headers["ETag"] = f"W/{headers['etag']}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+        
+        await self.app(scope, receive, compressing_send)
 
 # Include the router
 app.include_router(api_router)
 
+app.add_middleware(ConditionalGetMiddleware, paths=CONDITIONAL_GET_PATHS)
+app.add_middleware(CompressionMiddleware, compressor=response_compressor)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cross-origin pages read the keyset cursor for the next page
+    expose_headers=["X-Next-Cursor"],
 )
 
 logging.basicConfig(
@@ -3682,13 +5511,61 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await product_view_buffer.stop()
+    for task in list(background_tasks):
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    home_rankings.stop()
+    suggestion_index.stop()
+    facet_index.stop()
+    password_hash_pool.shutdown()
     client.close()
 
 @app.on_event("startup")
 async def startup_db():
-    # Create indexes
-    await db.users.create_index("email", unique=True)
-    await db.products.create_index("seller_id")
-    await db.orders.create_index("customer_id")
-    await db.notifications.create_index("user_id")
-    logger.info("Database indexes created")
+    # Reconcile indexes with the registry
+    index_report = await reconcile_indexes()
+    for collection_name, drift in index_report.items():
+        if drift["created"]:
+            logger.info(f"Created indexes on {collection_name}: {drift['created']}")
+        if drift["failed"] or drift["extra"] or drift["changed"]:
+            logger.warning(
+                f"Index drift on {collection_name}: failed={drift['failed']} "
+                f"extra={drift['extra']} changed={drift['changed']}"
+            )
+    logger.info("Database indexes reconciled")
+    
+    if await db.product_view_daily.estimated_document_count() == 0:
+        await rebuild_product_view_daily()
+        logger.info("Backfilled product_view_daily from product_views")
+    # Keyset cursors compare created_at as a date, and strings sort in a separate BSON type bracket
+    normalized = await db.products.update_many(
+        {"created_at": {"$type": "string"}},
+        [{"$set": {"created_at": {"$toDate": "$created_at"}}}]
+    )
+    if normalized.modified_count:
+        logger.info(f"Converted created_at to dates on {normalized.modified_count} products")
+    # Rollups written before platform rows had a sentinel key are rebuilt as well
+    if (
+        await db.revenue_rollups.estimated_document_count() == 0
+        or await db.revenue_rollups.find_one({"seller_id": None})
+    ):
+        await rebuild_revenue_rollups()
+        logger.info("Backfilled revenue_rollups from orders and platform_fees")
+    if await db.review_stats.estimated_document_count() == 0:
+        await rebuild_review_stats()
+        logger.info("Backfilled review_stats from reviews")
+    # Counters start from the full order and review history: on first deploy the collection is empty,
+    # and documents written by the old recompute-on-read code carry derived fields instead of counters
+    has_history = await db.orders.find_one({}, {"_id": 1}) or await db.reviews.find_one({}, {"_id": 1})
+    if (
+        (has_history and await db.seller_performance.estimated_document_count() == 0)
+        or await db.seller_performance.find_one({"rating": {"$exists": True}})
+    ):
+        await update_seller_performance()
+        logger.info("Backfilled seller_performance counters from orders and reviews")
+    
+    home_rankings.start()
+    product_view_buffer.start()
+    suggestion_index.start()
+    facet_index.start()
@@ -274,12 +274,7 @@ function HomePage() {
 
   useEffect(() => {
     fetchProducts();
-    fetchTrending();
-    fetchMostViewed();
-    fetchCategories();
-    fetchTicker();
-    fetchVisibility();
-    fetchBestsellers();
+    fetchHome();
     loadCart();
     if (user) {
       fetchNotifications();
@@ -302,7 +297,8 @@ function HomePage() {
 
   const fetchProducts = async () => {
     try {
-      const params = {};
+      // The home grid shows the first 8; "View All" pages through the rest
+      const params = { limit: 8, fields: 'card' };
       if (selectedCategory) params.category = selectedCategory;
       const response = await axios.get(`${API_URL}/products`, { params });
       setProducts(response.data);
@@ -311,57 +307,18 @@ function HomePage() {
     }
   };
 
-  const fetchTrending = async () => {
+  const fetchHome = async () => {
     try {
-      const response = await axios.get(`${API_URL}/products/trending`, { params: { limit: 8 } });
-      setTrending(response.data);
+      const response = await axios.get(`${API_URL}/home`, { params: { limit: 8 } });
+      const home = response.data;
+      setTrending(home.trending);
+      setMostViewed(home.most_viewed);
+      setBestsellers(home.bestsellers);
+      setAllCategories(home.categories);
+      setTickerMessage(home.ticker.message);
+      setVisibility(home.storefront_visibility);
     } catch (error) {
-      console.error('Error fetching trending:', error);
-    }
-  };
-
-  const fetchMostViewed = async () => {
-    try {
-      const response = await axios.get(`${API_URL}/products/most-viewed`, { params: { limit: 8 } });
-      setMostViewed(response.data);
-    } catch (error) {
-      console.error('Error fetching most viewed:', error);
-    }
-  };
-
-  const fetchVisibility = async () => {
-    try {
-      const response = await axios.get(`${API_URL}/storefront-visibility`);
-      setVisibility(response.data);
-    } catch (error) {
-      console.error('Error fetching visibility:', error);
-    }
-  };
-
-  const fetchBestsellers = async () => {
-    try {
-      const response = await axios.get(`${API_URL}/products/bestsellers`, { params: { limit: 8 } });
-      setBestsellers(response.data);
-    } catch (error) {
-      console.error('Error fetching bestsellers:', error);
-    }
-  };
-
-  const fetchCategories = async () => {
-    try {
-      const response = await axios.get(`${API_URL}/categories`);
-      setAllCategories(response.data.categories);
-    } catch (error) {
-      console.error('Error fetching categories:', error);
-    }
-  };
-
-  const fetchTicker = async () => {
-    try {
-      const response = await axios.get(`${API_URL}/ticker/active`);
-      setTickerMessage(response.data.message);
-    } catch (error) {
-      console.error('Error fetching ticker:', error);
+      console.error('Error fetching home page:', error);
     }
   };
 
@@ -147,14 +147,13 @@ function SellerHome() {
 
   const fetchStats = async () => {
     try {
-      const [products, orders, analytics] = await Promise.all([
-        axios.get(`${API_URL}/products`, { params: { seller_id: user.id } }),
+      const [orders, analytics] = await Promise.all([
         axios.get(`${API_URL}/orders/my`),
         axios.get(`${API_URL}/analytics/seller`)
       ]);
       
       setStats({
-        products: products.data.length,
+        products: analytics.data.active_products || 0,
         orders: orders.data.length,
         revenue: analytics.data.total_revenue || 0
       });
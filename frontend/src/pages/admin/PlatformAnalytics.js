@@ -14,21 +14,28 @@ import { toast } from 'sonner';
 
 const API_URL = process.env.REACT_APP_BACKEND_URL + '/api';
 
+const SELLER_PAGE_SIZE = 50;
+
 const COLORS = ['#8B5CF6', '#EC4899', '#10B981', '#F59E0B', '#3B82F6', '#EF4444', '#6366F1', '#14B8A6'];
 
 export default function PlatformAnalytics() {
   const { token } = useAuth();
   const [analytics, setAnalytics] = useState(null);
   const [sellerRevenue, setSellerRevenue] = useState(null);
+  const [topSellers, setTopSellers] = useState([]);
+  const [sellerSkip, setSellerSkip] = useState(0);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('overview');
   const navigate = useNavigate();
 
   useEffect(() => {
     fetchAnalytics();
-    fetchSellerRevenue();
   }, []);
 
+  useEffect(() => {
+    fetchSellerRevenue(sellerSkip);
+  }, [sellerSkip]);
+
   const fetchAnalytics = async () => {
     try {
       const response = await axios.get(`${API_URL}/analytics/admin`, {
@@ -43,12 +50,17 @@ export default function PlatformAnalytics() {
     }
   };
 
-  const fetchSellerRevenue = async () => {
+  const fetchSellerRevenue = async (skip) => {
     try {
       const response = await axios.get(`${API_URL}/analytics/admin/seller-revenue`, {
+        params: { skip, limit: SELLER_PAGE_SIZE },
         headers: { Authorization: `Bearer ${token}` }
       });
       setSellerRevenue(response.data);
+      // Charts and the top sellers list always show the first page (highest gross revenue)
+      if (skip === 0) {
+        setTopSellers(response.data.sellers || []);
+      }
     } catch (error) {
       console.error('Error fetching seller revenue:', error);
     }
@@ -74,17 +86,19 @@ export default function PlatformAnalytics() {
   };
 
   // Prepare chart data
-  const sellerChartData = sellerRevenue?.sellers?.slice(0, 8).map((seller, index) => ({
+  const sellerChartData = topSellers.slice(0, 8).map((seller, index) => ({
     name: seller.business_name?.substring(0, 15) || 'Unknown',
     revenue: seller.gross_revenue,
     payout: seller.net_revenue,
     fee: seller.platform_fee
-  })) || [];
+  }));
 
-  const pieData = sellerRevenue?.sellers?.slice(0, 6).map((seller, index) => ({
+  const pieData = topSellers.slice(0, 6).map((seller, index) => ({
     name: seller.business_name?.substring(0, 12) || 'Unknown',
     value: seller.gross_revenue
-  })) || [];
+  }));
+
+  const totalSellers = sellerRevenue?.summary?.total_sellers || 0;
 
   if (loading) {
     return (
@@ -241,7 +255,7 @@ export default function PlatformAnalytics() {
               </CardHeader>
               <CardContent>
                 <div className="space-y-4">
-                  {sellerRevenue?.sellers?.slice(0, 5).map((seller, index) => (
+                  {topSellers.slice(0, 5).map((seller, index) => (
                     <div key={seller.seller_id} className="flex items-center gap-4">
                       <div className="w-8 h-8 rounded-full bg-purple-100 flex items-center justify-center text-purple-600 font-bold">
                         {index + 1}
@@ -311,6 +325,32 @@ export default function PlatformAnalytics() {
                   </Table>
                 </div>
 
+                {totalSellers > SELLER_PAGE_SIZE && (
+                  <div className="flex items-center justify-between pt-4" data-testid="seller-revenue-pager">
+                    <p className="text-sm text-gray-500">
+                      Showing {sellerSkip + 1}-{Math.min(sellerSkip + SELLER_PAGE_SIZE, totalSellers)} of {totalSellers} sellers
+                    </p>
+                    <div className="flex gap-2">
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        disabled={sellerSkip === 0}
+                        onClick={() => setSellerSkip(Math.max(0, sellerSkip - SELLER_PAGE_SIZE))}
+                      >
+                        Previous
+                      </Button>
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        disabled={sellerSkip + SELLER_PAGE_SIZE >= totalSellers}
+                        onClick={() => setSellerSkip(sellerSkip + SELLER_PAGE_SIZE)}
+                      >
+                        Next
+                      </Button>
+                    </div>
+                  </div>
+                )}
+
                 {(!sellerRevenue?.sellers || sellerRevenue.sellers.length === 0) && (
                   <div className="text-center py-12 text-gray-500">
                     <Store className="w-12 h-12 mx-auto mb-4 text-gray-300" />
@@ -17,11 +17,16 @@ import { format } from 'date-fns';
 
 const API_URL = process.env.REACT_APP_BACKEND_URL + '/api';
 
+const SELLER_PAGE_SIZE = 50;
+const PAYOUT_POLL_INTERVAL_MS = 2000;
+const PAYOUT_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
 export default function SellerPayouts() {
   const { token } = useAuth();
   const navigate = useNavigate();
   const [payouts, setPayouts] = useState([]);
   const [sellerRevenue, setSellerRevenue] = useState(null);
+  const [sellerSkip, setSellerSkip] = useState(0);
   const [loading, setLoading] = useState(true);
   const [generating, setGenerating] = useState(false);
   const [selectedPayout, setSelectedPayout] = useState(null);
@@ -41,9 +46,7 @@ export default function SellerPayouts() {
         axios.get(`${API_URL}/admin/seller-payouts`, {
           headers: { Authorization: `Bearer ${token}` }
         }),
-        axios.get(`${API_URL}/analytics/admin/seller-revenue`, {
-          headers: { Authorization: `Bearer ${token}` }
-        })
+        fetchSellerRevenue(sellerSkip)
       ]);
       setPayouts(payoutsRes.data);
       setSellerRevenue(revenueRes.data);
@@ -54,6 +57,23 @@ export default function SellerPayouts() {
     }
   };
 
+  const fetchSellerRevenue = (skip) => {
+    return axios.get(`${API_URL}/analytics/admin/seller-revenue`, {
+      params: { skip, limit: SELLER_PAGE_SIZE },
+      headers: { Authorization: `Bearer ${token}` }
+    });
+  };
+
+  const changeSellerPage = async (skip) => {
+    try {
+      const response = await fetchSellerRevenue(skip);
+      setSellerSkip(skip);
+      setSellerRevenue(response.data);
+    } catch (error) {
+      toast.error('Failed to fetch seller summary');
+    }
+  };
+
   const generatePayouts = async () => {
     setGenerating(true);
     try {
@@ -62,7 +82,23 @@ export default function SellerPayouts() {
         {},
         { headers: { Authorization: `Bearer ${token}` } }
       );
-      toast.success(response.data.message || 'Payouts generated successfully');
+      let job = response.data.job;
+      const deadline = Date.now() + PAYOUT_POLL_TIMEOUT_MS;
+      const isActive = (j) => j && (j.status === 'queued' || j.status === 'running');
+      while (isActive(job) && Date.now() < deadline) {
+        await new Promise((resolve) => setTimeout(resolve, PAYOUT_POLL_INTERVAL_MS));
+        const jobRes = await axios.get(`${API_URL}/admin/payout-jobs/${job.id}`, {
+          headers: { Authorization: `Bearer ${token}` }
+        });
+        job = jobRes.data;
+      }
+      if (isActive(job)) {
+        toast.info('Payout generation is still running, refresh later to see the new payouts');
+      } else if (job?.status === 'failed') {
+        toast.error(job.error || 'Failed to generate payouts');
+      } else {
+        toast.success(`Generated ${job?.payouts_created ?? 0} payouts`);
+      }
       fetchData();
     } catch (error) {
       toast.error(error.response?.data?.detail || 'Failed to generate payouts');
@@ -126,6 +162,7 @@ export default function SellerPayouts() {
   const totalPending = payouts.filter(p => p.status === 'pending').reduce((sum, p) => sum + p.net_payout, 0);
   const totalPaid = payouts.filter(p => p.status === 'paid').reduce((sum, p) => sum + p.net_payout, 0);
   const totalProcessed = payouts.filter(p => p.status === 'processed').reduce((sum, p) => sum + p.net_payout, 0);
+  const totalSellers = sellerRevenue?.summary?.total_sellers || 0;
 
   if (loading) {
     return (
@@ -351,6 +388,32 @@ export default function SellerPayouts() {
                   </TableBody>
                 </Table>
 
+                {totalSellers > SELLER_PAGE_SIZE && (
+                  <div className="flex items-center justify-between pt-4" data-testid="seller-summary-pager">
+                    <p className="text-sm text-gray-500">
+                      Showing {sellerSkip + 1}-{Math.min(sellerSkip + SELLER_PAGE_SIZE, totalSellers)} of {totalSellers} sellers
+                    </p>
+                    <div className="flex gap-2">
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        disabled={sellerSkip === 0}
+                        onClick={() => changeSellerPage(Math.max(0, sellerSkip - SELLER_PAGE_SIZE))}
+                      >
+                        Previous
+                      </Button>
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        disabled={sellerSkip + SELLER_PAGE_SIZE >= totalSellers}
+                        onClick={() => changeSellerPage(sellerSkip + SELLER_PAGE_SIZE)}
+                      >
+                        Next
+                      </Button>
+                    </div>
+                  </div>
+                )}
+
                 {(!sellerRevenue?.sellers || sellerRevenue.sellers.length === 0) && (
                   <div className="text-center py-12 text-gray-500">
                     <Building className="w-12 h-12 mx-auto mb-4 text-gray-200" />
@@ -11,6 +11,8 @@ import { ArrowLeft, SlidersHorizontal, Package, Heart, Star } from 'lucide-react
 
 const API_URL = process.env.REACT_APP_BACKEND_URL + '/api';
 
+const PRODUCTS_PAGE_SIZE = 48;
+
 const sortOptions = [
   { value: 'recommended', label: 'Recommended' },
   { value: 'price_low_high', label: 'Price: Low to High' },
@@ -95,6 +97,8 @@ export default function CategoryPage() {
   const [products, setProducts] = useState([]);
   const [filteredProducts, setFilteredProducts] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [filtersOpen, setFiltersOpen] = useState(false);
   
   // Filters state
@@ -112,13 +116,18 @@ export default function CategoryPage() {
     applyFiltersAndSort();
   }, [products, sortBy, selectedSizes, selectedColors, priceRange, minRating]);
 
+  const fetchProductsPage = (cursor) => {
+    return axios.get(`${API_URL}/products`, {
+      params: { category: category, limit: PRODUCTS_PAGE_SIZE, cursor: cursor || undefined }
+    });
+  };
+
   const fetchProducts = async () => {
     setLoading(true);
     try {
-      const response = await axios.get(`${API_URL}/products`, {
-        params: { category: category }
-      });
+      const response = await fetchProductsPage(null);
       setProducts(response.data);
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching products:', error);
     } finally {
@@ -126,6 +135,19 @@ export default function CategoryPage() {
     }
   };
 
+  const loadMoreProducts = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await fetchProductsPage(nextCursor);
+      setProducts((prev) => [...prev, ...response.data]);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+    } catch (error) {
+      console.error('Error fetching products:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const applyFiltersAndSort = () => {
     let filtered = [...products];
 
@@ -431,6 +453,14 @@ export default function CategoryPage() {
             </div>
           </>
         )}
+
+        {!loading && nextCursor && (
+          <div className="text-center mt-6">
+            <Button variant="outline" onClick={loadMoreProducts} disabled={loadingMore} data-testid="load-more-products">
+              {loadingMore ? 'Loading...' : 'Load More Products'}
+            </Button>
+          </div>
+        )}
       </div>
     </div>
   );
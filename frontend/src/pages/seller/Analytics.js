@@ -66,11 +66,8 @@ export default function Analytics() {
     items: order.items?.length || 0
   })).reverse() || [];
 
-  // Order status distribution
-  const statusCounts = analytics?.orders?.reduce((acc, order) => {
-    acc[order.status] = (acc[order.status] || 0) + 1;
-    return acc;
-  }, {}) || {};
+  // Order status distribution (computed server-side across all orders)
+  const statusCounts = analytics?.status_breakdown || {};
 
   const statusChartData = Object.entries(statusCounts).map(([status, count]) => ({
     name: status.charAt(0).toUpperCase() + status.slice(1),
@@ -14,8 +14,12 @@ import { toast } from 'sonner';
 
 const API_URL = process.env.REACT_APP_BACKEND_URL + '/api';
 
+const PRODUCTS_PAGE_SIZE = 60;
+
 export default function ProductsManagement() {
   const [products, setProducts] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [showDialog, setShowDialog] = useState(false);
   const [editingProduct, setEditingProduct] = useState(null);
   const [categories, setCategories] = useState([]);
@@ -42,15 +46,33 @@ export default function ProductsManagement() {
     fetchPlatformSettings();
   }, []);
 
+  const fetchProductsPage = async (cursor) => {
+    const seller = await axios.get(`${API_URL}/sellers/me`);
+    return axios.get(`${API_URL}/products`, {
+      params: { seller_id: seller.data.id, limit: PRODUCTS_PAGE_SIZE, cursor: cursor || undefined }
+    });
+  };
+
   const fetchProducts = async () => {
     try {
-      const seller = await axios.get(`${API_URL}/sellers/me`);
-      const response = await axios.get(`${API_URL}/products`, {
-        params: { seller_id: seller.data.id }
-      });
+      const response = await fetchProductsPage(null);
       setProducts(response.data);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+    } catch (error) {
+      console.error('Error fetching products:', error);
+    }
+  };
+
+  const loadMoreProducts = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await fetchProductsPage(nextCursor);
+      setProducts((prev) => [...prev, ...response.data]);
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching products:', error);
+    } finally {
+      setLoadingMore(false);
     }
   };
 
@@ -454,6 +476,14 @@ export default function ProductsManagement() {
         ))}
       </div>
 
+      {nextCursor && (
+        <div className="text-center mt-6">
+          <Button variant="outline" onClick={loadMoreProducts} disabled={loadingMore} data-testid="load-more-products">
+            {loadingMore ? 'Loading...' : 'Load More Products'}
+          </Button>
+        </div>
+      )}
+
       {products.length === 0 && (
         <Card>
           <CardContent className="flex flex-col items-center justify-center py-12">
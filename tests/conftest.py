@@ -0,0 +1,12 @@
+import os
+import sys
+import uuid
+from pathlib import Path
+
+# server.py reads its Mongo settings at import time. Unit tests never connect; tests
+# that need MongoDB run against TEST_MONGO_URL in a throwaway database.
+TEST_MONGO_URL = os.environ.get("TEST_MONGO_URL")
+os.environ["MONGO_URL"] = TEST_MONGO_URL or os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+os.environ["DB_NAME"] = f"test_{uuid.uuid4().hex[:12]}"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
@@ -0,0 +1,25 @@
+import pytest
+
+from server import ResponseCompressor
+
+
+@pytest.fixture
+def compressor():
+    compressor = ResponseCompressor()
+    # Negotiation only; independent of whether the brotli package is installed
+    compressor.encodings = ["br", "gzip"]
+    return compressor
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip;q=1.0, br;q=0.5", "gzip"),
+    ("*", "br"),
+    ("br;q=0, *", "gzip"),
+    ("br;q=0, gzip;q=0, *;q=0.5", None),
+    ("gzip;q=0", None),
+    ("identity", None),
+    (None, None),
+])
+def test_choose_honours_q_values(compressor, accept_encoding, expected):
+    assert compressor.choose(accept_encoding) == expected
@@ -0,0 +1,48 @@
+import base64
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from server import decode_cursor, encode_cursor, keyset_filter
+
+
+def raw_cursor(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def test_round_trips_issued_cursors():
+    keyset = {"v": datetime(2024, 5, 1, 10, 30), "id": "p1"}
+    assert decode_cursor(encode_cursor(keyset)) == keyset
+    assert decode_cursor(encode_cursor({"skip": 50})) == {"skip": 50}
+
+
+@pytest.mark.parametrize("data", [
+    {"skip": "a"},
+    {"skip": -1},
+    {"skip": True},
+    {"v": {"$exists": True}, "id": "p1"},
+    {"v": [1, 2], "id": "p1"},
+    {"v": 10, "id": {"$gt": ""}},
+    {"v": 10},
+    {"v": 10, "id": "p1", "skip": 0},
+    {"v": {"$date": 5}, "id": "p1"},
+    ["skip", 1],
+])
+def test_rejects_malformed_cursors(data):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(raw_cursor(data))
+    assert error.value.status_code == 400
+
+
+def test_rejects_undecodable_cursor():
+    with pytest.raises(HTTPException) as error:
+        decode_cursor("not a cursor")
+    assert error.value.status_code == 400
+
+
+def test_offset_cursor_cannot_drive_keyset_filter():
+    with pytest.raises(HTTPException) as error:
+        keyset_filter("created_at", -1, decode_cursor(encode_cursor({"skip": 50})))
+    assert error.value.status_code == 400
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import server
+
+
+def matches(document, query):
+    for field, condition in query.items():
+        value = document.get(field)
+        if isinstance(condition, dict):
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+            if "$lt" in condition and not value < condition["$lt"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakePayoutJobs:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def update_many(self, query, update):
+        for document in self.documents:
+            if matches(document, query):
+                document.update(update["$set"])
+
+    async def update_one(self, query, update):
+        for document in self.documents:
+            if matches(document, query):
+                document.update(update["$set"])
+                return SimpleNamespace(modified_count=1)
+        return SimpleNamespace(modified_count=0)
+
+    async def find_one(self, query, projection=None):
+        return next((document for document in self.documents if matches(document, query)), None)
+
+
+class FakeOrders:
+    """Aggregation that runs for a while before yielding, like the blocking $group stages"""
+
+    def __init__(self, during_scan=None):
+        self.during_scan = during_scan
+
+    def aggregate(self, pipeline, **kwargs):
+        return self._rows()
+
+    async def _rows(self):
+        if self.during_scan:
+            self.during_scan()
+        await asyncio.sleep(0.05)
+        if self.during_scan:
+            self.during_scan()
+        return
+        yield
+
+
+class FakeDatabase:
+    def __init__(self, jobs, during_scan=None):
+        self.payout_jobs = FakePayoutJobs(jobs)
+        self.orders = FakeOrders(during_scan)
+
+
+def job(job_id, status, seconds_since_update):
+    return {
+        "id": job_id,
+        "status": status,
+        "error": None,
+        "updated_at": datetime.now(timezone.utc) - timedelta(seconds=seconds_since_update),
+    }
+
+
+def test_polling_fails_job_that_stopped_reporting(monkeypatch):
+    stale = server.PAYOUT_JOB_STALE_SECONDS + 60
+    jobs = [job("stale", "running", stale), job("other", "queued", stale), job("alive", "running", 5)]
+    monkeypatch.setattr(server, "db", FakeDatabase(jobs))
+
+    polled = asyncio.run(server.get_payout_job("stale", user={"id": "admin"}))
+    alive = asyncio.run(server.get_payout_job("alive", user={"id": "admin"}))
+
+    assert polled["status"] == "failed"
+    assert polled["error"]
+    assert alive["status"] == "running"
+    # Only the polled job is touched
+    assert jobs[1]["status"] == "queued"
+
+
+def test_finished_jobs_are_left_alone(monkeypatch):
+    jobs = [job("done", "completed", server.PAYOUT_JOB_STALE_SECONDS * 2)]
+    monkeypatch.setattr(server, "db", FakeDatabase(jobs))
+
+    polled = asyncio.run(server.get_payout_job("done", user={"id": "admin"}))
+
+    assert polled["status"] == "completed"
+    assert polled["error"] is None
+
+
+SETTINGS = {"platform_fee_percentage": 2.0, "promotion_fee_percentage": 0.0}
+
+
+def run_job(job_id):
+    start_date, end_date = server.payout_period(7)
+    asyncio.run(server.run_payout_job(job_id, SETTINGS, start_date, end_date))
+
+
+def test_heartbeat_keeps_long_scan_fresh(monkeypatch):
+    jobs = [job("slow", "queued", 0)]
+    heartbeats = []
+    monkeypatch.setattr(server, "db", FakeDatabase(jobs, during_scan=lambda: heartbeats.append(jobs[0]["updated_at"])))
+    monkeypatch.setattr(server, "PAYOUT_JOB_HEARTBEAT_SECONDS", 0.01)
+
+    run_job("slow")
+
+    # updated_at moved on while the scan had yielded nothing
+    assert heartbeats[1] > heartbeats[0]
+    assert jobs[0]["status"] == "completed"
+
+
+def test_expired_job_is_not_revived(monkeypatch):
+    jobs = [job("expired", "queued", 0)]
+
+    def expire():
+        jobs[0].update(status="failed", error="Payout job stopped responding")
+
+    monkeypatch.setattr(server, "db", FakeDatabase(jobs, during_scan=expire))
+    run_job("expired")
+
+    assert jobs[0]["status"] == "failed"
+    assert jobs[0]["error"] == "Payout job stopped responding"
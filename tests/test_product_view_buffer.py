@@ -0,0 +1,54 @@
+import asyncio
+from datetime import datetime, timezone
+
+import server
+
+
+class SlowCollection:
+    """Writes that take a while, so stop() lands in the middle of a flush"""
+
+    def __init__(self, writes):
+        self.writes = writes
+
+    async def bulk_write(self, requests, ordered=True):
+        await asyncio.sleep(0.05)
+        self.writes.extend(requests)
+
+    async def insert_many(self, documents, ordered=True):
+        await asyncio.sleep(0.05)
+        self.writes.extend(documents)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.inserted = []
+        self.products = SlowCollection([])
+        self.product_view_daily = SlowCollection([])
+        self.product_views = SlowCollection(self.inserted)
+
+
+def view(product_id):
+    return {"product_id": product_id, "viewed_at": datetime.now(timezone.utc)}
+
+
+def test_stop_waits_for_in_flight_flush(monkeypatch):
+    fake_db = FakeDatabase()
+    monkeypatch.setattr(server, "db", fake_db)
+
+    async def run():
+        buffer = server.ProductViewBuffer(flush_seconds=0.01)
+        buffer.start()
+        buffer.add(view("p1"))
+        buffer.add(view("p2"))
+        # The loop has swapped the events out and is waiting on the writes
+        await asyncio.sleep(0.03)
+        assert buffer.stats()["pending"] == 0
+        buffer.add(view("p3"))
+        await buffer.stop()
+        return buffer.stats()
+
+    stats = asyncio.run(run())
+
+    assert stats["flushed"] == 3
+    assert stats["dropped"] == 0
+    assert [event["product_id"] for event in fake_db.inserted] == ["p1", "p2", "p3"]
@@ -0,0 +1,65 @@
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+from server import PLATFORM_ROLLUP, client, db, rebuild_revenue_rollups
+
+requires_mongo = pytest.mark.skipif(
+    not os.environ.get("TEST_MONGO_URL"), reason="set TEST_MONGO_URL to run against MongoDB"
+)
+
+
+def order(order_id, created_at, total_amount, status):
+    return {"id": order_id, "created_at": created_at, "total_amount": total_amount, "status": status}
+
+
+def fee(order_id, seller_id, created_at, order_amount, fee_amount):
+    return {
+        "order_id": order_id,
+        "seller_id": seller_id,
+        "created_at": created_at,
+        "order_amount": order_amount,
+        "fee_amount": fee_amount,
+        "seller_payout": order_amount - fee_amount,
+    }
+
+
+@requires_mongo
+def test_backfill_rollups_from_existing_orders():
+    async def run():
+        day_one = datetime(2024, 5, 1, 10, 30)
+        day_two = datetime(2024, 5, 2, 18, 0)
+        await db.orders.insert_many([
+            order("o1", day_one, 300.0, "delivered"),
+            # Seed-era documents carry ISO string timestamps
+            order("o2", "2024-05-01T12:00:00+00:00", 200.0, "pending"),
+            order("o3", day_two, 100.0, "delivered"),
+        ])
+        await db.platform_fees.insert_many([
+            fee("o1", "seller-a", day_one, 300.0, 6.0),
+            fee("o2", "seller-b", day_one, 200.0, 4.0),
+            fee("o3", "seller-a", day_two, 100.0, 2.0),
+        ])
+        try:
+            await rebuild_revenue_rollups()
+            return await db.revenue_rollups.find({}, {"_id": 0}).to_list(None)
+        finally:
+            await client.drop_database(db.name)
+
+    rows = {(row["day"], row["seller_id"]): row for row in asyncio.run(run())}
+
+    platform = rows[("2024-05-01", PLATFORM_ROLLUP)]
+    assert platform["orders"] == 2
+    assert platform["total_amount"] == 500.0
+    assert platform["platform_fee"] == 10.0
+    assert platform["status"] == {"delivered": 1, "pending": 1}
+    assert rows[("2024-05-02", PLATFORM_ROLLUP)]["orders"] == 1
+
+    seller_a = rows[("2024-05-01", "seller-a")]
+    assert seller_a["orders"] == 1
+    assert seller_a["gross_revenue"] == 300.0
+    assert seller_a["seller_payout"] == 294.0
+    assert rows[("2024-05-02", "seller-a")]["gross_revenue"] == 100.0
+    assert not any(seller_id is None for _, seller_id in rows)
@@ -0,0 +1,30 @@
+from server import seller_performance_view
+
+
+def test_view_of_stored_counters_document():
+    # Shape written by the $inc upserts, which use seller_id as the filter
+    counters = {
+        "seller_id": "seller-1",
+        "total_orders": 4,
+        "completed_orders": 3,
+        "cancelled_orders": 1,
+        "rating_sum": 9,
+        "total_reviews": 2,
+    }
+
+    performance = seller_performance_view("seller-1", counters)
+
+    assert performance["seller_id"] == "seller-1"
+    assert performance["total_orders"] == 4
+    assert performance["fulfillment_rate"] == 75.0
+    assert performance["rating"] == 4.5
+    assert performance["total_reviews"] == 2
+
+
+def test_view_without_counters():
+    performance = seller_performance_view("seller-2", None)
+
+    assert performance["seller_id"] == "seller-2"
+    assert performance["total_orders"] == 0
+    assert performance["fulfillment_rate"] == 0.0
+    assert performance["rating"] == 0.0
@@ -0,0 +1,56 @@
+import asyncio
+
+import server
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length):
+        return self.documents
+
+
+class FakeProducts:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, *args, **kwargs):
+        return FakeCursor(self.documents)
+
+
+class FakeDatabase:
+    def __init__(self, products):
+        self.products = FakeProducts(products)
+
+
+PRODUCTS = [
+    {"id": "p1", "name": "Slim Fit Denim Jacket", "category": "Men", "price": 2499.0, "images": ["a.jpg"], "view_count": 40},
+    {"id": "p2", "name": "Denim Shirt", "category": "Men", "price": 1299.0, "images": [], "view_count": 90},
+    {"id": "p3", "name": "Running Sneakers", "category": "Footwear", "price": 3199.0, "images": ["b.jpg"], "view_count": 10},
+]
+
+
+def test_bulk_load_matches_incremental_upserts(monkeypatch):
+    monkeypatch.setattr(server, "db", FakeDatabase(PRODUCTS))
+    loaded = server.SuggestionIndex()
+    asyncio.run(loaded.load())
+
+    incremental = server.SuggestionIndex()
+    for product in reversed(PRODUCTS):
+        incremental.upsert(product)
+
+    assert loaded._keys == sorted(loaded._keys)
+    assert loaded._keys == incremental._keys
+    assert loaded._categories == {"Men": 2, "Footwear": 1}
+
+
+def test_suggest_after_bulk_load(monkeypatch):
+    monkeypatch.setattr(server, "db", FakeDatabase(PRODUCTS))
+    index = server.SuggestionIndex()
+    asyncio.run(index.load())
+
+    result = index.suggest("den")
+
+    assert [card["id"] for card in result["products"]] == ["p2", "p1"]
+    assert index.suggest("sneak j")["products"] == []